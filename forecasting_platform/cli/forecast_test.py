@@ -103,7 +103,7 @@ class TestCliEngineRunType:
         assert result.exit_code == 0
         assert re.search(r"Successfully ran forecast for 0 account\(s\)", result.output, re.MULTILINE)
 
-    @pytest.mark.parametrize("output_format", ["csv", "xlsx"])  # type: ignore
+    @pytest.mark.parametrize("output_format", ["csv", "xlsx", "parquet"])  # type: ignore
     def test_output_format(
         self,
         engine_run_type: EngineRunType,
@@ -247,7 +247,9 @@ class TestCliEngineRunType:
     def test_output_format_invalid_option(self, engine_run_type: EngineRunType, cli_runner: CliRunner) -> None:
         result = run_command(cli_runner, engine_run_type, "--output-format", "foo")
         assert result.exit_code == 2
-        assert re.match("(.|\n)*Invalid value for '--output-format': Value must be 'csv' or 'xlsx'.", result.output)
+        assert re.match(
+            "(.|\n)*Invalid value for '--output-format': Value must be 'csv', 'xlsx' or 'parquet'.", result.output
+        )
 
     def test_only_model_config(
         self, engine_run_type: EngineRunType, cli_runner: CliRunner, monkeypatch: MonkeyPatch, caplog: LogCaptureFixture
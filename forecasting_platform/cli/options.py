@@ -65,7 +65,7 @@ def forecast_options(engine_run_type: EngineRunType) -> Callable[[F], F]:
             callback=validate_output_format,
             default=master_config.default_output_format.value,
             show_default=True,
-            help="Choose 'csv' or 'xlsx' file output format.",
+            help="Choose 'csv', 'xlsx' or 'parquet' file output format.",
         ),
         click.option(
             "--optimize-hyperparameters",
@@ -49,7 +49,7 @@ def validate_output_format(ctx: click.Context, param: click.Parameter, value: st
     try:
         return OutputFormat(value)
     except ValueError:
-        raise click.BadParameter("Value must be 'csv' or 'xlsx''")
+        raise click.BadParameter("Value must be 'csv', 'xlsx' or 'parquet'")
 
 
 def validate_model_config(ctx: click.Context, param: click.Parameter, value: Optional[str]) -> Optional[str]:
@@ -40,13 +40,24 @@ database_schema = {
 db_connection_attempts = 5
 #: Database connection timeout for each connection attempt.
 db_connection_timeout_seconds = 3
-#: Seconds to wait after a failed database connection attempt before trying again.
+#: Seconds to wait after the first failed database connection attempt, doubled for each further attempt.
 db_connection_retry_sleep_seconds = 3
 #: Maximum number of database read retries in case of an :class:`~pyodbc.OperationalError`.
 #: Set to ``0`` disable retries i.e only one read attempt will be performed.
 db_read_retries = 2
-#: Seconds to wait after a failed database read attempt before trying again.
+#: Seconds to wait after the first failed database read attempt, doubled for each further attempt.
 db_read_retry_sleep_seconds = 1
+#: Number of database connections kept open for reuse by each :class:`~forecasting_platform.services.Database`.
+db_pool_size = 5
+#: Number of additional database connections, which can be opened temporarily if all pooled connections are in use.
+db_max_overflow = 10
+#: Seconds after which a pooled database connection is replaced, to avoid using connections closed by the server.
+db_pool_recycle_seconds = 1800
+#: Number of database connections used concurrently to insert chunks of large data frames.
+#: Should not exceed :py:attr:`db_pool_size`.
+db_insert_parallelism = 4
+#: Maximum number of values inserted per chunk, chunks contain at most 10000 rows.
+db_insert_max_parameters = 200000
 
 # Forecasting platform default configuration
 #: Default number of months to predict.
@@ -67,6 +78,7 @@ log_level_file = logging.DEBUG
 #: Log level for console logging.
 log_level_console = logging.INFO
 #: Logging format as defined in :class:`~logging.Formatter`.
+#: Thread and process attributes are not collected for log records, so they cannot be used here.
 logging_format = "%(asctime)s::%(levelname)s::%(name)s::%(account)s::%(message)s"
 
 #: Logging timestamp format as defined in :class:`~logging.Formatter`.
@@ -83,6 +95,8 @@ account_processed_data_path = f"03 Processed data/monthly_process/{account_proce
 
 #: Number of models to process in parallel.
 max_parallel_models = 8
+#: Cancel models which have not started yet, as soon as one of the parallel models failed.
+fail_fast_models = False
 
 #: List of model configurations to forecast.
 #: To enable efficient parallelism of the platform, make sure to put long running accounts at the beginning of the list.
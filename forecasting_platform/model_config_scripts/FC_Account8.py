@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy as np
 import pandas as pd
 from forecasting_platform.helpers.identifier import (
     AccountID,
@@ -35,10 +36,10 @@ class ModelConfigAccount8(BaseModelConfig):
 
     @staticmethod
     def _replace_replenishment_project_ids(sales_raw: pd.DataFrame) -> pd.DataFrame:
-        sales_raw = sales_raw.copy()
         replace_ids = {
             ProjectID("Project_365"): ProjectID("Project_364"),
         }
+        project_ids = sales_raw["Project_ID"].to_numpy()
         for old, new in replace_ids.items():
-            sales_raw.loc[sales_raw["Project_ID"] == old, "Project_ID"] = new
-        return sales_raw
+            project_ids = np.where(project_ids == old, new, project_ids)
+        return sales_raw.assign(Project_ID=project_ids)
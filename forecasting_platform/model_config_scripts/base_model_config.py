@@ -67,13 +67,14 @@ class BaseModelConfig(metaclass=ABCMeta):
         self._runtime_config = runtime_config
         self._data_loader = data_loader
 
+        prediction_month = runtime_config.prediction_month.strftime(PREDICTION_MONTH_FORMAT)
         self.forecast_path = absolute_path(
             runtime_config.output_path
             / "08 Predictions"
             / f"Forecast {self.MODEL_NAME}"
-            / f"{runtime_config.prediction_month.strftime(PREDICTION_MONTH_FORMAT)}"
+            / prediction_month
             / f"{runtime_config.run_timestamp}"
-            f"_{runtime_config.prediction_month.strftime(PREDICTION_MONTH_FORMAT)}"
+            f"_{prediction_month}"
             f"_T{runtime_config.test_periods}"
             f"_P{runtime_config.predict_periods}"
             f"_{'_'.join(self.GROUPING)}"
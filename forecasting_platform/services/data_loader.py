@@ -181,8 +181,13 @@ class DataLoader:
             logger.warning(f"Removed {raw_dsx_input_len - len(raw_dsx_input)} rows with invalid dates.")
 
         # Temporary code to filter Account_6 data, until this is done by DSX as expected.
-        raw_dsx_input_len = len(raw_dsx_input)
-        tmp_filter_mask = raw_dsx_input["lowlevelcust"].isin(
+        # The membership test is only evaluated for the (few) rows of the adhoc contract.
+        # Missing contract IDs compare as <NA>, they are converted to False to allow boolean indexing.
+        adhoc_contract = (raw_dsx_input["contractid"] == ContractID("Contract_730")).to_numpy(
+            dtype=bool, na_value=False
+        )
+        adhoc_customers = raw_dsx_input.loc[adhoc_contract, "lowlevelcust"]
+        adhoc_mask = adhoc_customers.isin(
             [
                 AccountID("Account 18"),
                 AccountID("Account 293"),
@@ -191,10 +196,10 @@ class DataLoader:
                 AccountID("Account 47"),
             ]
         )
-        tmp_filter_mask &= raw_dsx_input["contractid"] == ContractID("Contract_730")
-        raw_dsx_input = raw_dsx_input.loc[~tmp_filter_mask]  # TODO FSC-371 remove this block
-        if len(raw_dsx_input) < raw_dsx_input_len:
-            logger.warning(f"Removed {raw_dsx_input_len - len(raw_dsx_input)} unexpected rows of adhoc contract.")
+        adhoc_rows = adhoc_customers.index[adhoc_mask.to_numpy()]
+        if len(adhoc_rows) > 0:
+            raw_dsx_input = raw_dsx_input.drop(index=adhoc_rows)  # TODO FSC-371 remove this block
+            logger.warning(f"Removed {len(adhoc_rows)} unexpected rows of adhoc contract.")
 
         return raw_dsx_input
 
@@ -212,15 +217,15 @@ class DataLoader:
     @retry_database_read_errors
     def _load_cleaning_input_data_from_database(self) -> pd.DataFrame:
         with self._dsx_read_database.transaction_context() as session:
+            # Only select required columns to avoid transferring and converting unused (wide) columns
             dsx_data = pd.read_sql(
-                session.query(DsxInput).statement,  # type: ignore
+                session.query(*[DsxInput.c[column] for column in DSX_INPUT_DTYPES]).statement,  # type: ignore
                 session.bind,
-                columns=list(DSX_INPUT_DTYPES.keys()),
                 parse_dates=["perioddate"],
             ).astype(DSX_INPUT_DTYPES)
 
         logger.info(f"Loaded cleaning input data with {len(dsx_data)} rows from DSX database")
-        return dsx_data[list(DSX_INPUT_DTYPES.keys())]
+        return dsx_data
 
     def load_exogenous_feature_input_data(self) -> pd.DataFrame:
         """Load exogenous feature input data from DSX.
@@ -270,9 +275,10 @@ class DataLoader:
     def _load_exogenous_feature_input_from_database(self) -> pd.DataFrame:
         with self._dsx_read_database.transaction_context() as session:
             exogenous_features = pd.read_sql(
-                session.query(DsxExogenousFeature).statement,  # type: ignore
+                session.query(  # type: ignore
+                    *[DsxExogenousFeature.c[column] for column in DSX_EXOGENOUS_DATA_DTYPES]
+                ).statement,
                 session.bind,
-                columns=list(DSX_EXOGENOUS_DATA_DTYPES.keys()),
                 parse_dates=["perioddate"],
             ).astype(DSX_EXOGENOUS_DATA_DTYPES)
         exogenous_features.rename(columns=DSX_EXOGENOUS_DATA_COLUMN_MAPPING, inplace=True)
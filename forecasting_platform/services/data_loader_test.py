@@ -1,4 +1,3 @@
-import gzip
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +13,7 @@ import pandas as pd
 import pytest
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
+from _pytest.tmpdir import TempPathFactory
 from forecasting_platform import master_config
 from forecasting_platform.internal_schema import (
     CleanedData,
@@ -67,19 +67,67 @@ EXPECTED_DATA = {
     "Order_Cost": [0.0, 2.0],
 }
 
+TEST_DATA_FRAME = pd.DataFrame(TEST_DATA)
+EXPECTED_DATA_FRAME = pd.DataFrame(EXPECTED_DATA)
+# Loading from CSV files converts Item_ID to int32 explicitly
+EXPECTED_CSV_DATA_FRAME = EXPECTED_DATA_FRAME.astype({"Item_ID": np.int32})
+
 
 DUMMY_CLEANED_DATA_RUN_ID = 13337  # High integer to not interfere with other cleaning tests during integration testing
 DUMMY_EXOGENOUS_FEATURE_RUN_ID = -123
 
 
+EXOGENOUS_FEATURE_DATA_TEMPLATE = pd.DataFrame(
+    {
+        "Airframe": np.array(["Airframe_1", "Airframe_1"], dtype=object),
+        "Contract_ID": np.array(["Contract_1", "Contract_1"], dtype=object),
+        "Project_ID": np.array(["Project_1", "Project_1"], dtype=object),
+        "Date": np.array([datetime(2015, 1, 1), datetime(2016, 1, 1)], dtype="datetime64[ns]"),
+        "Value": np.array([25.60, 25.60], dtype=np.float64),
+    }
+)
+
+CLEANING_INPUT_COLUMNS = [
+    "lowlevelcust",
+    "projectid",
+    "contractid",
+    "shortid",
+    "perioddate",
+    "Cost",
+    "Adjusted History",
+    "masterpart",
+]
+
+CLEANING_INPUT_DATA_FRAME = pd.DataFrame(
+    [
+        # this one will be kept after cleaning
+        ["Account_18", "Project_0", "Contract_0", 1, pd.Timestamp("2020-02-01"), 1.0, 1.0, "mn0"],
+        # this one will be removed due to adhoc contract in dsx data workaround in TODO FSC-371
+        ["Account_18", "Project_0", "Contract_730", 1, pd.Timestamp("2020-02-01"), 1.0, 1.0, "mn0"],
+        # this one will be removed due to wrong days in dsx data workaround in TODO FSC-318
+        ["Account_18", "Project_0", "Contract_0", 1, pd.Timestamp("2020-02-28"), 1.0, 1.0, "mn0"],
+        # this one will be kept, a missing contract does not match the adhoc contract
+        ["Account_18", "Project_0", None, 1, pd.Timestamp("2020-02-01"), 1.0, 1.0, "mn0"],
+    ],
+    columns=CLEANING_INPUT_COLUMNS,
+).astype({"contractid": "string"})
+
+EXPECTED_CLEANING_INPUT_DATA_FRAME = pd.DataFrame(
+    [
+        # these will be kept after cleaning
+        ["Account_18", "Project_0", "Contract_0", 1, pd.Timestamp("2020-02-01"), 1.0, 1.0, "mn0"],
+        ["Account_18", "Project_0", None, 1, pd.Timestamp("2020-02-01"), 1.0, 1.0, "mn0"],
+    ],
+    columns=CLEANING_INPUT_COLUMNS,
+    index=[0, 3],
+).astype({"contractid": "string"})
+
+
 def generate_exogenous_feature_data(periodic_data_stream: str) -> pd.DataFrame:
-    return pd.DataFrame(
-        [
-            [periodic_data_stream, "Airframe_1", "Contract_1", "Project_1", datetime(2015, 1, 1), 25.60],
-            [periodic_data_stream, "Airframe_1", "Contract_1", "Project_1", datetime(2016, 1, 1), 25.60],
-        ],
-        columns=DSX_EXOGENOUS_DATA_COLUMN_MAPPING.values(),
-    )
+    exogenous_feature_data = EXOGENOUS_FEATURE_DATA_TEMPLATE.copy()
+    exogenous_feature_data.insert(0, "Periodic_Data_Stream", periodic_data_stream)
+    assert list(exogenous_feature_data.columns) == list(DSX_EXOGENOUS_DATA_COLUMN_MAPPING.values())
+    return exogenous_feature_data
 
 
 class ModelConfigAccountTestDummy(BaseModelConfig):
@@ -98,10 +146,8 @@ class ModelConfigAccountTestDummy(BaseModelConfig):
     def prepare_training_data(
         self, sales: pd.DataFrame, grouping: List[str], exo_features: ExogenousFeatures,
     ) -> TimeSeries:
-        dummy_time_series = TimeSeries(
-            pd.DataFrame(data={"date": [datetime.utcnow()], "response": [1]}), "date", "response"
-        )
-        return dummy_time_series
+        # Fixed date instead of the current time, so the dummy training data is deterministic
+        return TimeSeries(pd.DataFrame(data={"date": [pd.Timestamp(2020, 1, 1)], "response": [1]}), "date", "response")
 
     def postprocess_forecast(
         self, ts: TimeSeries, ts_pred: TimeSeries, sales: pd.DataFrame, grouping: List[str]
@@ -109,20 +155,25 @@ class ModelConfigAccountTestDummy(BaseModelConfig):
         return pd.DataFrame()
 
 
-@pytest.fixture()  # type: ignore
-def prepare_database() -> Iterator[None]:
-    expected_dataframe = pd.DataFrame(EXPECTED_DATA)
-    expected_dataframe["run_id"] = DUMMY_CLEANED_DATA_RUN_ID
+@pytest.fixture(scope="module")  # type: ignore
+def internal_database() -> Database:
+    """Share one internal database engine between all tests of this module."""
+    return Database(DatabaseType.internal)
 
-    cleanup_query = Query(CleanedData).filter(CleanedData.c.run_id == DUMMY_CLEANED_DATA_RUN_ID)  # type: ignore
-    delete_test_data(cleanup_query)  # Cleanup in case of previously failed test
 
-    internal_database = Database(DatabaseType.internal)
-    with internal_database.transaction_context() as session:
-        cleaned_data_count = (
-            session.query(CleanedData).filter(CleanedData.c.run_id == DUMMY_CLEANED_DATA_RUN_ID).count()  # type: ignore
-        )
-    assert cleaned_data_count == 0
+@pytest.fixture(scope="module")  # type: ignore
+def dsx_read_database() -> Database:
+    """Share one dsx_read database engine between all tests of this module."""
+    return Database(DatabaseType.dsx_read)
+
+
+@pytest.fixture(scope="module")  # type: ignore
+def prepare_database(internal_database: Database) -> Iterator[None]:
+    """Insert cleaned data once for all tests of this module, which only read the data."""
+    expected_dataframe = EXPECTED_DATA_FRAME.assign(run_id=DUMMY_CLEANED_DATA_RUN_ID)
+
+    cleanup_query = Query(CleanedData).filter(CleanedData.c.run_id == DUMMY_CLEANED_DATA_RUN_ID)  # type: ignore
+    delete_test_data(cleanup_query)  # Cleanup in case of previously failed test, committed before the insert below
 
     with internal_database.transaction_context() as session:
         expected_dataframe.to_sql(
@@ -139,48 +190,66 @@ def prepare_database() -> Iterator[None]:
 
 
 @pytest.fixture()  # type: ignore
-def model_config() -> BaseModelConfig:
+def model_config(internal_database: Database, dsx_read_database: Database) -> BaseModelConfig:
     runtime_config = RuntimeConfig(EngineRunType.backward)
-    internal_database = Database(DatabaseType.internal)
-    dsx_read_database = Database(DatabaseType.dsx_read)
     data_loader = DataLoader(internal_database, dsx_read_database)
 
     return ModelConfigAccountTestDummy(runtime_config, data_loader)
 
 
+@pytest.fixture(scope="module")  # type: ignore
+def account_data_location(tmp_path_factory: TempPathFactory) -> Path:
+    """Base directory for account data CSV files, shared by all tests of this module."""
+    return tmp_path_factory.mktemp("account_data")
+
+
+@pytest.fixture(scope="module")  # type: ignore
+def account_processed_data_path(account_data_location: Path, request: Any) -> str:
+    """Write compressed account data CSV files once per parametrized ``account_processed_data_path``."""
+    account_processed_data_path: str = request.param
+    account_data_directory = account_data_location / account_processed_data_path
+    account_data_directory.mkdir(exist_ok=True, parents=True)
+
+    contract_data = dict(tuple(TEST_DATA_FRAME.groupby("Contract_ID", sort=False)))
+    for contract in ModelConfigAccountTestDummy.CONTRACTS:
+        contract_data[contract].to_csv(
+            account_data_directory / f"DSX_{contract}_Data.csv.gz",
+            index=False,
+            compression={"method": "gzip", "compresslevel": 1},
+        )
+    return account_processed_data_path
+
+
 @pytest.mark.parametrize(
-    "account_processed_data_path", [master_config.account_processed_data_path, "ensure other path can be configured",]
+    "account_processed_data_path",
+    [master_config.account_processed_data_path, "ensure other path can be configured",],
+    indirect=True,
 )  # type: ignore
 def test_load_account_data_if_internal_database_disabled(
-    tmp_path: Path, monkeypatch: MonkeyPatch, account_processed_data_path: str, caplog: LogCaptureFixture
+    account_data_location: Path,
+    monkeypatch: MonkeyPatch,
+    account_processed_data_path: str,
+    caplog: LogCaptureFixture,
+    internal_database: Database,
+    dsx_read_database: Database,
 ) -> None:
-    caplog.set_level(logging.INFO)
+    caplog.set_level(logging.INFO, logger="data_loader")
 
     runtime_config = RuntimeConfig(EngineRunType.backward)
-    internal_database = Database(DatabaseType.internal)
-    dsx_read_database = Database(DatabaseType.dsx_read)
-    internal_database.is_disabled = lambda: True  # type: ignore
+    monkeypatch.setattr(internal_database, "is_disabled", lambda: True)  # Patch is undone for other tests
     data_loader = DataLoader(internal_database, dsx_read_database)
 
     monkeypatch.setattr(master_config, "account_processed_data_path", account_processed_data_path)
-    monkeypatch.setattr(master_config, "default_data_loader_location", tmp_path)
+    monkeypatch.setattr(master_config, "default_data_loader_location", account_data_location)
 
     model_config = ModelConfigAccountTestDummy(runtime_config, data_loader)
-
-    account_data_paths = []
-    for contract in model_config.CONTRACTS:
-        account_data_path = Path(account_processed_data_path) / f"DSX_{contract}_Data.csv.gz"
-        (tmp_path / account_processed_data_path).mkdir(exist_ok=True, parents=True)
-        with gzip.open(tmp_path / account_data_path, "wt") as f:
-            df = pd.DataFrame(TEST_DATA)
-            f.write(df.loc[df["Contract_ID"] == contract].to_csv(None, index=False))
-        account_data_paths.append(account_data_path)
+    account_data_paths = [
+        Path(account_processed_data_path) / f"DSX_{contract}_Data.csv.gz" for contract in model_config.CONTRACTS
+    ]
 
     account_data = data_loader.load_account_data(model_config, -1)
 
-    expected_data = pd.DataFrame(EXPECTED_DATA)
-    expected_data["Item_ID"] = expected_data["Item_ID"].astype(np.int32)
-    assert_frame_equal(expected_data, account_data)
+    assert_frame_equal(EXPECTED_CSV_DATA_FRAME, account_data)
     assert (
         "Internal database connection disabled in master_config. Loading account data from csv file." in caplog.messages
     )
@@ -191,11 +260,10 @@ def test_load_account_data_if_internal_database_disabled(
 def test_load_account_data(
     prepare_database: Iterator[None], model_config: BaseModelConfig, caplog: LogCaptureFixture
 ) -> None:
-    caplog.set_level(logging.INFO)
+    caplog.set_level(logging.INFO, logger="data_loader")
     account_data = model_config._data_loader.load_account_data(model_config, DUMMY_CLEANED_DATA_RUN_ID)
 
-    expected_df = pd.DataFrame(EXPECTED_DATA)
-    assert_frame_equal(expected_df, account_data)
+    assert_frame_equal(EXPECTED_DATA_FRAME, account_data)
     assert "Loaded account data with 2 rows from internal database" in caplog.messages
 
 
@@ -210,7 +278,7 @@ def test_load_account_data_raises_if_data_is_not_in_database(model_config: BaseM
 def test_load_exogenous_feature_with_database_disabled(
     feature_name: str, tmp_path: Path, monkeypatch: MonkeyPatch, caplog: LogCaptureFixture
 ) -> None:
-    caplog.set_level(logging.INFO)
+    caplog.set_level(logging.INFO, logger="data_loader")
 
     test_data = pd.DataFrame(
         [
@@ -256,12 +324,12 @@ def test_load_exogenous_feature_with_database_disabled(
     )
 
 
-def test_load_exogenous_data_from_internal_database_empty(caplog: LogCaptureFixture) -> None:
-    caplog.set_level(logging.INFO)
+def test_load_exogenous_data_from_internal_database_empty(
+    caplog: LogCaptureFixture, internal_database: Database, dsx_read_database: Database
+) -> None:
+    caplog.set_level(logging.INFO, logger="data_loader")
 
-    data_loader = DataLoader(
-        internal_database=Database(DatabaseType.internal), dsx_read_database=Database(DatabaseType.dsx_read)
-    )
+    data_loader = DataLoader(internal_database=internal_database, dsx_read_database=dsx_read_database)
 
     with pytest.raises(DataException, match='Exogenous feature data is empty for Periodic_Data_Stream "Not found"'):
         data_loader.load_exogenous_feature("Not found", DUMMY_EXOGENOUS_FEATURE_RUN_ID)
@@ -269,18 +337,24 @@ def test_load_exogenous_data_from_internal_database_empty(caplog: LogCaptureFixt
     assert "Loaded exogenous data with 0 rows from internal database" in caplog.messages
 
 
-@pytest.fixture()  # type: ignore
-def with_exogenous_data_in_internal_database() -> Iterator[None]:
+@pytest.fixture(scope="module")  # type: ignore
+def with_exogenous_data_in_internal_database(internal_database: Database) -> Iterator[None]:
+    """Insert exogenous feature data once for all tests of this module, which only read the data."""
     cleanup_data_query = Query(ExogenousFeature).filter(
         ExogenousFeature.c.run_id == DUMMY_EXOGENOUS_FEATURE_RUN_ID
     )  # type: ignore
     delete_test_data(cleanup_data_query)  # Cleanup in case of previously failed test
 
-    for periodic_data_stream in ["Stream-DB-Test1", "Stream-DB-Test2", "Stream-DB-Test3"]:
-        test_data = generate_exogenous_feature_data(periodic_data_stream)
-        Database(DatabaseType.internal).insert_data_frame(
-            test_data.assign(run_id=DUMMY_EXOGENOUS_FEATURE_RUN_ID), EXOGENOUS_FEATURE_TABLE
-        )
+    test_data = pd.concat(
+        [
+            generate_exogenous_feature_data(periodic_data_stream)
+            for periodic_data_stream in ["Stream-DB-Test1", "Stream-DB-Test2", "Stream-DB-Test3"]
+        ],
+        ignore_index=True,
+    )
+    internal_database.insert_data_frame(
+        test_data.assign(run_id=DUMMY_EXOGENOUS_FEATURE_RUN_ID), EXOGENOUS_FEATURE_TABLE
+    )
 
     yield
 
@@ -288,13 +362,14 @@ def with_exogenous_data_in_internal_database() -> Iterator[None]:
 
 
 def test_load_exogenous_data_from_internal_database(
-    caplog: LogCaptureFixture, with_exogenous_data_in_internal_database: None
+    caplog: LogCaptureFixture,
+    with_exogenous_data_in_internal_database: None,
+    internal_database: Database,
+    dsx_read_database: Database,
 ) -> None:
-    caplog.set_level(logging.INFO)
+    caplog.set_level(logging.INFO, logger="data_loader")
 
-    data_loader = DataLoader(
-        internal_database=Database(DatabaseType.internal), dsx_read_database=Database(DatabaseType.dsx_read)
-    )
+    data_loader = DataLoader(internal_database=internal_database, dsx_read_database=dsx_read_database)
 
     result = data_loader.load_exogenous_feature("Stream-DB-Test2", DUMMY_EXOGENOUS_FEATURE_RUN_ID)
 
@@ -302,54 +377,20 @@ def test_load_exogenous_data_from_internal_database(
     assert "Loaded exogenous data with 2 rows from internal database" in caplog.messages
 
 
-def test_load_cleaning_input_data(caplog: LogCaptureFixture, monkeypatch: MonkeyPatch) -> None:
-    caplog.set_level(logging.WARNING)
+def test_load_cleaning_input_data(
+    caplog: LogCaptureFixture, monkeypatch: MonkeyPatch, internal_database: Database, dsx_read_database: Database
+) -> None:
+    caplog.set_level(logging.WARNING, logger="data_loader")
 
     def mock_load_csv(*args: Any, **kwargs: Any) -> pd.DataFrame:
-        return pd.DataFrame(
-            [
-                # this one will be kept after cleaning
-                ["Account_18", "Project_0", "Contract_0", 1, pd.Timestamp("2020-02-01"), 1.0, 1.0, "mn0"],
-                # this one will be removed due to adhoc contract in dsx data workaround in TODO FSC-371
-                ["Account_18", "Project_0", "Contract_730", 1, pd.Timestamp("2020-02-01"), 1.0, 1.0, "mn0"],
-                # this one will be removed due to wrong days in dsx data workaround in TODO FSC-318
-                ["Account_18", "Project_0", "Contract_0", 1, pd.Timestamp("2020-02-28"), 1.0, 1.0, "mn0"],
-            ],
-            columns=[
-                "lowlevelcust",
-                "projectid",
-                "contractid",
-                "shortid",
-                "perioddate",
-                "Cost",
-                "Adjusted History",
-                "masterpart",
-            ],
-        )
+        return CLEANING_INPUT_DATA_FRAME.copy(deep=False)
 
     monkeypatch.setattr(DataLoader, "load_csv", mock_load_csv)
-    internal_database = Database(DatabaseType.internal)
-    dsx_read_database = Database(DatabaseType.dsx_read)
-    dsx_read_database.is_disabled = lambda: True  # type: ignore
+    monkeypatch.setattr(dsx_read_database, "is_disabled", lambda: True)  # Patch is undone for other tests
     data_loader = DataLoader(internal_database, dsx_read_database)
 
-    assert data_loader.load_cleaning_input_data().equals(
-        pd.DataFrame(
-            [
-                # this one will be kept after cleaning
-                ["Account_18", "Project_0", "Contract_0", 1, pd.Timestamp("2020-02-01"), 1.0, 1.0, "mn0"]
-            ],
-            columns=[
-                "lowlevelcust",
-                "projectid",
-                "contractid",
-                "shortid",
-                "perioddate",
-                "Cost",
-                "Adjusted History",
-                "masterpart",
-            ],
-        )
-    )
+    result = data_loader.load_cleaning_input_data()
+
+    assert_frame_equal(result, EXPECTED_CLEANING_INPUT_DATA_FRAME)
     assert "Removed 1 rows with invalid dates." in caplog.messages
     assert "Removed 1 unexpected rows of adhoc contract." in caplog.messages
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
 from logging import getLogger
 from pathlib import Path
@@ -40,6 +45,9 @@ if TYPE_CHECKING:
 
 logger = getLogger("data_output")
 
+# Shared by all DataOutput instances of a process, the worker thread is only started on first use
+_result_file_executor = ThreadPoolExecutor(max_workers=1)
+
 
 class DataOutput:
     """Store and save output data into a database or file system."""
@@ -68,8 +76,7 @@ class DataOutput:
         assert forecast_run_id is not None, "forecast_run_id cannot be None when the internal database is enabled"
         cleaned_data = cleaned_data.assign(run_id=forecast_run_id)
 
-        self._internal_database.insert_data_frame(cleaned_data, CLEANED_DATA_TABLE)
-
+        # Replace outdated data and insert new data within one transaction
         with self._internal_database.transaction_context() as session:
             deleted_count = (
                 session.query(CleanedData)  # type: ignore
@@ -78,16 +85,28 @@ class DataOutput:
             )
             logger.info(f"Deleted {deleted_count} rows of outdated cleaned data from internal database.")
 
+            self._internal_database.insert_data_frame(cleaned_data, CLEANED_DATA_TABLE, session=session)
+
     def _store_cleaned_data_files(self, cleaned_data: pd.DataFrame) -> None:
         output_path = Path(master_config.default_data_loader_location) / master_config.account_processed_data_path
         output_path.mkdir(parents=True, exist_ok=True)
         logger.info(f"Storing cleaning result to local files in directory {output_path}")
 
-        contracts = cleaned_data["Contract_ID"].unique()
-        for contract in contracts:
-            out = cleaned_data.loc[cleaned_data["Contract_ID"] == contract].copy()
-            if len(out) > 0:
-                out.to_csv(output_path / f"DSX_{contract}_Data.csv.gz", index=False)
+        def _store_contract_file(contract: str, contract_data: pd.DataFrame) -> None:
+            contract_data.to_csv(
+                output_path / f"DSX_{contract}_Data.csv.gz",
+                index=False,
+                compression={"method": "gzip", "compresslevel": 1},
+            )
+
+        # Split data in a single pass and write files concurrently, zlib compression releases the GIL
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(_store_contract_file, contract, contract_data)
+                for contract, contract_data in cleaned_data.groupby("Contract_ID", sort=False, observed=True)
+            ]
+            for future in futures:
+                future.result()
 
     def store_exogenous_features(self, exogenous_feature: pd.DataFrame, forecast_run_id: Optional[int]) -> None:
         """Store exogenous feature data in the internal database.
@@ -105,8 +124,7 @@ class DataOutput:
         assert forecast_run_id is not None, "forecast_run_id cannot be None when the internal database is enabled"
         exogenous_feature = exogenous_feature.assign(run_id=forecast_run_id)
 
-        self._internal_database.insert_data_frame(exogenous_feature, EXOGENOUS_FEATURE_TABLE)
-
+        # Replace outdated data and insert new data within one transaction
         with self._internal_database.transaction_context() as session:
             deleted_count = (
                 session.query(ExogenousFeature)  # type: ignore
@@ -115,6 +133,8 @@ class DataOutput:
             )
             logger.info(f"Deleted {deleted_count} rows of outdated exogenous feature data from internal database.")
 
+            self._internal_database.insert_data_frame(exogenous_feature, EXOGENOUS_FEATURE_TABLE, session=session)
+
     def store_result(self, path: Path, df: pd.DataFrame, include_index: bool = False) -> Path:
         """Save :class:`pandas.DataFrame` to a file.
 
@@ -139,7 +159,7 @@ class DataOutput:
         path_with_extension = DataOutput._change_file_extension(path, output_format.value)
 
         if "Actual" in df.columns:
-            df["Actual"] = df["Actual"].astype("Int64")
+            df = df.assign(Actual=df["Actual"].astype("Int64"))
 
         if self._runtime_config.engine_run_type == EngineRunType.backward:
             df = df.rename(columns={"Prediction_Start_Month": "Prediction_End_Month"})
@@ -148,6 +168,8 @@ class DataOutput:
             df.to_csv(path_with_extension, index=include_index)
         elif output_format == OutputFormat.xlsx:
             df.to_excel(path_with_extension, index=include_index)
+        elif output_format == OutputFormat.parquet:
+            df.to_parquet(path_with_extension, engine="pyarrow", compression="snappy", index=include_index)
 
         logger.debug(f'Created "{path_with_extension}"')
         return path_with_extension
@@ -202,6 +224,10 @@ class DataOutput:
         Development run forecasts are stored in internal database.
         Production run forecasts are stored in internal and DSX database.
 
+        The result file is written while the forecast is stored in the internal database.
+        If writing the result file fails, the error is raised before the forecast is stored in the DSX database,
+        but the forecast might already be stored in the internal database.
+
         Args:
             account_data: Cleaned data with actual values of order quantities
             model_config: Model config instance of this forecast.
@@ -222,9 +248,36 @@ class DataOutput:
             actuals_newest_month=actuals_newest_month,
         )
 
-        forecast_file_path = self.store_result(model_config.forecast_path / "result_data", forecast_data)
+        # Write the result file in the background, while the forecast is stored in the internal database
+        file_future = _result_file_executor.submit(
+            self.store_result, model_config.forecast_path / "result_data", forecast_data
+        )
+        try:
+            model_run = self._store_forecast_in_databases(
+                model_config,
+                model_run,
+                account_data=account_data,
+                forecast_data=forecast_data,
+                forecast_post=forecast_post,
+                result_file=file_future,
+            )
+        except BaseException:
+            wait([file_future])  # Do not leave the file write running after a failed database insert
+            raise
+        forecast_file_path = file_future.result()
+
         logger.info(f'Stored forecast with {len(forecast_data.index)} lines in "{forecast_file_path}"')
+        return model_run
 
+    def _store_forecast_in_databases(
+        self,
+        model_config: BaseModelConfig,
+        model_run: ForecastModelRun,
+        account_data: pd.DataFrame,
+        forecast_data: pd.DataFrame,
+        forecast_post: pd.DataFrame,
+        result_file: Future[Path],
+    ) -> ForecastModelRun:
         if self._runtime_config.engine_run_type == EngineRunType.backward:
             logger.info("Skip storing forecast in internal database for backward run.")
             return model_run
@@ -235,6 +288,7 @@ class DataOutput:
                 model_config=model_config, account_data=account_data, forecast_post=forecast_post,
             )
             model_run = self._store_forecast_in_internal_database(forecast_data, model_run)
+            result_file.result()  # Only publish the forecast to DSX after the result file was written successfully
             return self._store_forecast_in_dsx_database(dsx_output_data, model_run)
         else:
             assert False, f"Invalid EngineRunType: {self._runtime_config.engine_run_type}"
@@ -297,28 +351,42 @@ class DataOutput:
         raw_prediction_df = raw_prediction_df.astype({column: "category" for column in model_config.GROUPING})
         post_prediction_df = post_prediction_df.astype({column: "category" for column in model_config.GROUPING})
 
-        assert raw_prediction_df[grouping].equals(
-            post_prediction_df[grouping]
+        assert self._has_equal_grouping(
+            raw_prediction_df, post_prediction_df, model_config.GROUPING
         ), "Granularity and order of raw and post prediction results is not the same"
 
-        forecast_data = raw_prediction_df[["Item_ID", "Contract_ID"]].copy()
-
         prediction_start_month = self._runtime_config.prediction_month
-        predicted_month = pd.to_datetime(raw_prediction_df["Date"], format="%Y-%m-%d")
-        prediction_months_delta = (predicted_month - prediction_start_month) / np.timedelta64(1, "M")
-
-        forecast_data["Prediction_Start_Month"] = prediction_start_month.strftime(PREDICTION_MONTH_FORMAT)
-        forecast_data["Predicted_Month"] = predicted_month.dt.strftime(PREDICTION_MONTH_FORMAT)
-        forecast_data["Prediction_Months_Delta"] = np.round(abs(prediction_months_delta)).astype(np.int32)
-        forecast_data["Prediction_Raw"] = raw_prediction_df["Order_Quantity"]
-        forecast_data["Prediction_Post"] = post_prediction_df["Order_Quantity"]
-
-        forecast_data["Actual"] = self._extract_actuals(
-            account_data, forecast_data, model_config.GROUPING, actuals_newest_month
+        # Monthly resolution allows exact month arithmetic and formatting in NumPy instead of per-element strftime
+        predicted_date = pd.to_datetime(raw_prediction_df["Date"], format="%Y-%m-%d")
+        predicted_month = predicted_date.to_numpy().astype("datetime64[M]")
+        prediction_months_delta = predicted_month - np.datetime64(prediction_start_month, "M")
+        predicted_month_str = np.char.replace(np.datetime_as_string(predicted_month), "-", "")
+
+        prediction_post = post_prediction_df["Order_Quantity"].to_numpy()
+        actual = self._extract_actuals(
+            account_data,
+            raw_prediction_df[model_config.GROUPING].assign(Predicted_Month=predicted_month_str),
+            model_config.GROUPING,
+            actuals_newest_month,
+        ).to_numpy()
+        accuracy = compute_accuracy(pd.DataFrame({"Actual": actual, "Prediction_Post": prediction_post}))
+
+        # Build the result in one step, instead of growing the frame column by column
+        return pd.DataFrame(
+            {
+                "Item_ID": raw_prediction_df["Item_ID"],
+                "Contract_ID": raw_prediction_df["Contract_ID"],
+                "Prediction_Start_Month": DataOutput._constant_category(
+                    prediction_start_month.strftime(PREDICTION_MONTH_FORMAT), len(raw_prediction_df)
+                ),
+                "Predicted_Month": predicted_month_str,
+                "Prediction_Months_Delta": np.abs(prediction_months_delta.astype(np.int32)),
+                "Prediction_Raw": raw_prediction_df["Order_Quantity"].to_numpy(),
+                "Prediction_Post": prediction_post,
+                "Actual": actual,
+                "Accuracy": accuracy.to_numpy(),
+            }
         )
-        forecast_data["Accuracy"] = compute_accuracy(forecast_data)
-
-        return forecast_data
 
     @staticmethod
     def _convert_dsx_output_data(
@@ -326,9 +394,11 @@ class DataOutput:
     ) -> pd.DataFrame:
 
         prediction = forecast_post.loc[(forecast_post["type"] == "predict")]
-        wa_master_number = account_data[["Item_ID", "Wesco_Master_Number"]]
-        wa_master_number = wa_master_number.groupby(["Item_ID"])[["Wesco_Master_Number"]].first().reset_index()
-        prediction = prediction.merge(wa_master_number, on="Item_ID", how="left")
+        # Lookup by unique Item_ID instead of joining the (large) prediction frame with a small table
+        wa_master_number = account_data.groupby("Item_ID")["Wesco_Master_Number"].first()
+        prediction = prediction.assign(
+            Wesco_Master_Number=wa_master_number.reindex(prediction["Item_ID"].to_numpy()).to_numpy()
+        )
 
         dsx_output_data = (
             prediction.groupby(model_config.GROUPING + ["Wesco_Master_Number", "Date"], observed=True)["Order_Quantity"]
@@ -340,20 +410,24 @@ class DataOutput:
         dsx_output_data["Ship To"] = np.nan
         dsx_output_data["binid"] = np.nan
         dsx_output_data["branch"] = np.nan
-        dsx_output_data["PeriodicDataElementType"] = "Forecast"
-        dsx_output_data["PeriodicDataElement"] = "Additional Forecast 1"
+        dsx_output_data["PeriodicDataElementType"] = DataOutput._constant_category("Forecast", len(dsx_output_data))
+        dsx_output_data["PeriodicDataElement"] = DataOutput._constant_category(
+            "Additional Forecast 1", len(dsx_output_data)
+        )
         dsx_output_data["NewItemFlag"] = 0
         dsx_output_data["CreatedDateTime"] = datetime.utcnow()
-        dsx_output_data["Value"] = np.round(dsx_output_data["Order_Quantity"]).map(int)
-        dsx_output_data["Item Name"] = dsx_output_data.agg(
-            lambda row: f"Global|ContractID_Master_Part|{row['Contract_ID']}|{row['Wesco_Master_Number']}", axis=1
+        dsx_output_data["Value"] = np.rint(dsx_output_data["Order_Quantity"].to_numpy()).astype(np.int64)
+        dsx_output_data["Item Name"] = (
+            "Global|ContractID_Master_Part|"
+            + dsx_output_data["Contract_ID"].astype(str)
+            + "|"
+            + dsx_output_data["Wesco_Master_Number"].astype(str)
         )
         dsx_output_data["PeriodDate"] = pd.to_datetime(dsx_output_data["Date"], format="%Y-%m-%d").dt.strftime(
             "%Y-%m-%d %H:%M:%S.%f"
         )
 
-        dsx_output_data = dsx_output_data.reset_index()
-        dsx_output_data.rename(columns={"index": "STG_Import_Periodic_ML_RowID"}, inplace=True)
+        dsx_output_data["STG_Import_Periodic_ML_RowID"] = np.arange(len(dsx_output_data), dtype=np.int64)
 
         return dsx_output_data[
             [
@@ -372,11 +446,32 @@ class DataOutput:
             ]
         ]
 
+    @staticmethod
+    def _constant_category(value: str, length: int) -> pd.Categorical:
+        """Create a column repeating ``value`` as a single category, which only stores one byte per row."""
+        return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
+
+    @staticmethod
+    def _has_equal_grouping(left: pd.DataFrame, right: pd.DataFrame, categorical_grouping: List[str]) -> bool:
+        """Compare grouping and ``Date`` values of both predictions on the underlying arrays.
+
+        Categorical columns are compared by categories and integer codes instead of element-wise category values.
+        """
+        if len(left) != len(right):
+            return False
+
+        for column in categorical_grouping:
+            if not left[column].cat.categories.equals(right[column].cat.categories):
+                return False
+            if not np.array_equal(left[column].cat.codes.to_numpy(), right[column].cat.codes.to_numpy()):
+                return False
+
+        return bool(np.array_equal(left["Date"].to_numpy(), right["Date"].to_numpy()))
+
     @staticmethod
     def _add_model_run_id(df: pd.DataFrame, model_run_id: int) -> pd.DataFrame:
         assert model_run_id > 0
-        df["model_run_id"] = model_run_id
-        return df
+        return df.assign(model_run_id=model_run_id)
 
     @staticmethod
     def _extract_actuals(
@@ -384,18 +479,27 @@ class DataOutput:
     ) -> pd.DataFrame:
         assert "Date" not in grouping, f'Unexpected grouping, did not expect "Date": {grouping}'
 
-        df = account_data[grouping + ["Date", "Order_Quantity"]].copy()
-        df["Date"] = df.Date.dt.strftime(PREDICTION_MONTH_FORMAT)
+        keys = forecast_data[grouping].assign(Month_YYYYMM=forecast_data["Predicted_Month"].astype(np.int64))
+
+        # Match months on integer YYYYMM keys instead of formatting every date of the account data as string
+        dates = account_data["Date"].dt
+        account_months = (dates.year * 100 + dates.month).to_numpy()
 
-        df = df.groupby(grouping + ["Date"], observed=True)["Order_Quantity"].sum().reset_index()
+        # Only aggregate actuals of months covered by the forecast
+        in_forecast_months = (account_months >= keys["Month_YYYYMM"].min()) & (
+            account_months <= keys["Month_YYYYMM"].max()
+        )
+        df = account_data.loc[in_forecast_months, grouping + ["Order_Quantity"]].assign(
+            Month_YYYYMM=account_months[in_forecast_months]
+        )
 
-        df = df.rename(columns={"Date": "Predicted_Month"})
+        df = df.groupby(grouping + ["Month_YYYYMM"], observed=True, sort=False)["Order_Quantity"].sum().reset_index()
 
-        actuals = forecast_data.merge(df, how="left", on=grouping + ["Predicted_Month"])
+        actuals = keys.merge(df, how="left", on=grouping + ["Month_YYYYMM"])
 
-        newest_month_str = actuals_newest_month.strftime(PREDICTION_MONTH_FORMAT)
-        actuals.loc[
-            actuals["Order_Quantity"].isna() & (actuals["Predicted_Month"] <= newest_month_str), "Order_Quantity"
-        ] = 0
+        # Missing actuals up to the newest imported month are known to be zero
+        newest_month = actuals_newest_month.year * 100 + actuals_newest_month.month
+        order_quantity = actuals["Order_Quantity"].to_numpy(dtype=np.float64)
+        is_zero = np.isnan(order_quantity) & (actuals["Month_YYYYMM"].to_numpy() <= newest_month)
 
-        return np.round(actuals["Order_Quantity"])
+        return pd.Series(np.round(np.where(is_zero, 0.0, order_quantity)), index=actuals.index, name="Order_Quantity")
@@ -1,12 +1,8 @@
 import logging
 from datetime import datetime
-from operator import itemgetter
 from pathlib import Path
-from typing import (
-    Any,
-    Dict,
-    List,
-)
+from typing import Dict
+from unittest.mock import Mock
 
 import numpy as np
 import pandas as pd
@@ -33,248 +29,93 @@ from forecasting_platform.static import (
 from forecasting_platform.test_utils import delete_test_data
 from pandas._testing import assert_frame_equal
 from sqlalchemy.orm import Query
+from sqlalchemy.sql.expression import Select
 
 TEST_FREEZE_TIME = "2010-12-31"
+TEST_FREEZE_TIMESTAMP = pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d")
 
 TEST_ACCOUNT_1_POST_DATA = pd.DataFrame(
-    [
-        ["Contract_402", 1005, 0, "2019-06-01", 0.0, "predict"],
-        ["Contract_402", 1005, 1, "2019-06-01", 0.0, "predict"],
-        ["Contract_402", 1005, 2, "2019-06-01", 0.0, "predict"],
-        ["Contract_402", 1005, 0, "2019-07-01", 3.8, "predict"],
-        ["Contract_402", 2178, 0, "2019-06-01", 1.3, "predict"],
-        ["Contract_402", 2178, 0, "2019-07-01", 1.4, "predict"],
-        ["Contract_402", 2178, 0, "2019-08-01", 1.8, "predict"],
-        ["Contract_402", 2178, 0, "2019-09-01", 1.8, "predict"],
-        ["Contract_402", 2178, 0, "2019-10-01", 1.8, "predict"],
-        ["Contract_402", 2178, 0, "2019-11-01", 1.6, "predict"],
-        ["Contract_402", 2178, 0, "2019-12-01", 1.8, "predict"],
-        ["Contract_402", 2178, 0, "2020-01-01", 1.6, "predict"],
-        ["Contract_402", 2178, 0, "2020-02-01", 1.8, "predict"],
-    ],
-    columns=["Contract_ID", "Item_ID", "Build_Rate_Flag", "Date", "Order_Quantity", "type"],
+    {
+        "Contract_ID": np.array(["Contract_402"] * 13, dtype=object),
+        "Item_ID": np.array([1005, 1005, 1005, 1005] + [2178] * 9, dtype=np.int64),
+        "Build_Rate_Flag": np.array([0, 1, 2] + [0] * 10, dtype=np.int64),
+        "Date": np.array(
+            ["2019-06-01", "2019-06-01", "2019-06-01", "2019-07-01"]
+            + ["2019-06-01", "2019-07-01", "2019-08-01", "2019-09-01", "2019-10-01"]
+            + ["2019-11-01", "2019-12-01", "2020-01-01", "2020-02-01"],
+            dtype=object,
+        ),
+        "Order_Quantity": np.array([0.0, 0.0, 0.0, 3.8, 1.3, 1.4, 1.8, 1.8, 1.8, 1.6, 1.8, 1.6, 1.8], dtype=np.float64),
+        "type": np.array(["predict"] * 13, dtype=object),
+    }
 )
 
 TEST_ACCOUNT_1_RAW_DATA = pd.DataFrame(
-    [
-        # "train" values will be filtered out
-        ["Contract_402", 1005, 0, "2019-05-01", 0.0, "train"],
+    {
+        "Contract_ID": np.array(["Contract_402"] * 14, dtype=object),
+        "Item_ID": np.array([1005, 1005, 1005, 1005, 1005] + [2178] * 9, dtype=np.int64),
         # predictions with exogenous features but same granularity will be summed up
-        ["Contract_402", 1005, 0, "2019-06-01", 3.7, "predict"],
-        ["Contract_402", 1005, 1, "2019-06-01", 3.7, "predict"],
-        ["Contract_402", 1005, 2, "2019-06-01", 3.7, "predict"],
-        ["Contract_402", 1005, 0, "2019-07-01", 3.8, "predict"],
-        ["Contract_402", 2178, 0, "2019-06-01", 1.3, "predict"],
-        ["Contract_402", 2178, 0, "2019-07-01", 1.4, "predict"],
-        ["Contract_402", 2178, 0, "2019-08-01", 1.8, "predict"],
-        ["Contract_402", 2178, 0, "2019-09-01", 1.8, "predict"],
-        ["Contract_402", 2178, 0, "2019-10-01", 1.8, "predict"],
-        ["Contract_402", 2178, 0, "2019-11-01", 1.6, "predict"],
-        ["Contract_402", 2178, 0, "2019-12-01", 1.8, "predict"],
-        ["Contract_402", 2178, 0, "2020-01-01", 1.6, "predict"],
-        ["Contract_402", 2178, 0, "2020-02-01", 1.8, "predict"],
-    ],
-    columns=["Contract_ID", "Item_ID", "Build_Rate_Flag", "Date", "Order_Quantity", "type"],
+        "Build_Rate_Flag": np.array([0, 0, 1, 2] + [0] * 10, dtype=np.int64),
+        "Date": np.array(
+            ["2019-05-01", "2019-06-01", "2019-06-01", "2019-06-01", "2019-07-01"]
+            + ["2019-06-01", "2019-07-01", "2019-08-01", "2019-09-01", "2019-10-01"]
+            + ["2019-11-01", "2019-12-01", "2020-01-01", "2020-02-01"],
+            dtype=object,
+        ),
+        "Order_Quantity": np.array(
+            [0.0, 3.7, 3.7, 3.7, 3.8, 1.3, 1.4, 1.8, 1.8, 1.8, 1.6, 1.8, 1.6, 1.8], dtype=np.float64
+        ),
+        # "train" values will be filtered out
+        "type": np.array(["train"] + ["predict"] * 13, dtype=object),
+    }
 )
 
 TEST_ACCOUNT_1_EXPECTED_FORECAST_DATA = pd.DataFrame(
-    [
-        [1005, "Contract_402", "202002", "201906", 8, 11.1, 0.0, 0.0, 1.0],
-        [1005, "Contract_402", "202002", "201907", 7, 3.8, 3.8, 8.0, 0.475],
-        [2178, "Contract_402", "202002", "201906", 8, 1.3, 1.3, 0.0, 0.0],
-        [2178, "Contract_402", "202002", "201907", 7, 1.4, 1.4, 4.0, 0.350],
-        [2178, "Contract_402", "202002", "201908", 6, 1.8, 1.8, 0.0, 0.0],
-        [2178, "Contract_402", "202002", "201909", 5, 1.8, 1.8, 8.0, 0.225],
-        [2178, "Contract_402", "202002", "201910", 4, 1.8, 1.8, 0.0, 0.0],
-        [2178, "Contract_402", "202002", "201911", 3, 1.6, 1.6, 4.0, 0.400],
-        [2178, "Contract_402", "202002", "201912", 2, 1.8, 1.8, 0.0, 0.0],
-        [2178, "Contract_402", "202002", "202001", 1, 1.6, 1.6, np.nan, np.nan],
-        [2178, "Contract_402", "202002", "202002", 0, 1.8, 1.8, np.nan, np.nan],
-    ],
-    columns=[
-        "Item_ID",
-        "Contract_ID",
-        "Prediction_Start_Month",
-        "Predicted_Month",
-        "Prediction_Months_Delta",
-        "Prediction_Raw",
-        "Prediction_Post",
-        "Actual",
-        "Accuracy",
-    ],
-).astype({"Item_ID": "category", "Contract_ID": "category", "Prediction_Months_Delta": np.int32})
+    {
+        "Item_ID": pd.Categorical.from_codes(np.array([0, 0] + [1] * 9, dtype=np.int8), categories=[1005, 2178]),
+        "Contract_ID": pd.Categorical.from_codes(np.zeros(11, dtype=np.int8), categories=["Contract_402"]),
+        "Prediction_Start_Month": pd.Categorical.from_codes(np.zeros(11, dtype=np.int8), categories=["202002"]),
+        "Predicted_Month": np.array(
+            ["201906", "201907", "201906", "201907", "201908", "201909"]
+            + ["201910", "201911", "201912", "202001", "202002"],
+            dtype=object,
+        ),
+        "Prediction_Months_Delta": np.array([8, 7, 8, 7, 6, 5, 4, 3, 2, 1, 0], dtype=np.int32),
+        "Prediction_Raw": np.array([11.1, 3.8, 1.3, 1.4, 1.8, 1.8, 1.8, 1.6, 1.8, 1.6, 1.8], dtype=np.float64),
+        "Prediction_Post": np.array([0.0, 3.8, 1.3, 1.4, 1.8, 1.8, 1.8, 1.6, 1.8, 1.6, 1.8], dtype=np.float64),
+        "Actual": np.array([0.0, 8.0, 0.0, 4.0, 0.0, 8.0, 0.0, 4.0, 0.0, np.nan, np.nan], dtype=np.float64),
+        "Accuracy": np.array([1.0, 0.475, 0.0, 0.350, 0.0, 0.225, 0.0, 0.400, 0.0, np.nan, np.nan], dtype=np.float64),
+    }
+)
 
 TEST_ACCOUNT_1_EXPECTED_DSX_OUTPUT_DATA = pd.DataFrame(
-    [
-        [
-            0,
-            "Global|ContractID_Master_Part|Contract_402|mn_28400",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-06-01 00:00:00.000000",
-            0,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            1,
-            "Global|ContractID_Master_Part|Contract_402|mn_28400",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-07-01 00:00:00.000000",
-            4,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            2,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-06-01 00:00:00.000000",
-            1,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            3,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-07-01 00:00:00.000000",
-            1,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            4,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-08-01 00:00:00.000000",
-            2,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            5,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-09-01 00:00:00.000000",
-            2,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            6,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-10-01 00:00:00.000000",
-            2,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            7,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-11-01 00:00:00.000000",
-            2,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            8,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2019-12-01 00:00:00.000000",
-            2,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            9,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2020-01-01 00:00:00.000000",
-            2,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-        [
-            10,
-            "Global|ContractID_Master_Part|Contract_402|mn_98712",
-            np.nan,
-            np.nan,
-            np.nan,
-            np.nan,
-            "Forecast",
-            "Additional Forecast 1",
-            "2020-02-01 00:00:00.000000",
-            2,
-            0,
-            pd.to_datetime(TEST_FREEZE_TIME, format="%Y-%m-%d"),
-        ],
-    ],
-    columns=[
-        "STG_Import_Periodic_ML_RowID",
-        "Item Name",
-        "Ship To",
-        "projectid",
-        "binid",
-        "branch",
-        "PeriodicDataElementType",
-        "PeriodicDataElement",
-        "PeriodDate",
-        "Value",
-        "NewItemFlag",
-        "CreatedDateTime",
-    ],
+    {
+        "STG_Import_Periodic_ML_RowID": np.arange(11, dtype=np.int64),
+        "Item Name": np.array(
+            ["Global|ContractID_Master_Part|Contract_402|mn_28400"] * 2
+            + ["Global|ContractID_Master_Part|Contract_402|mn_98712"] * 9,
+            dtype=object,
+        ),
+        "Ship To": np.full(11, np.nan),
+        "projectid": np.full(11, np.nan),
+        "binid": np.full(11, np.nan),
+        "branch": np.full(11, np.nan),
+        "PeriodicDataElementType": pd.Categorical.from_codes(np.zeros(11, dtype=np.int8), categories=["Forecast"]),
+        "PeriodicDataElement": pd.Categorical.from_codes(
+            np.zeros(11, dtype=np.int8), categories=["Additional Forecast 1"]
+        ),
+        "PeriodDate": np.array(
+            [
+                f"{month} 00:00:00.000000"
+                for month in ["2019-06-01", "2019-07-01", "2019-06-01", "2019-07-01", "2019-08-01", "2019-09-01"]
+                + ["2019-10-01", "2019-11-01", "2019-12-01", "2020-01-01", "2020-02-01"]
+            ],
+            dtype=object,
+        ),
+        "Value": np.array([0, 4, 1, 1, 2, 2, 2, 2, 2, 2, 2], dtype=np.int64),
+        "NewItemFlag": np.zeros(11, dtype=np.int64),
+        "CreatedDateTime": np.full(11, TEST_FREEZE_TIMESTAMP.to_datetime64()),
+    }
 )
 
 
@@ -299,84 +140,155 @@ EXPECTED_DATA = (
 RUNTIME_CONFIG = RuntimeConfig(EngineRunType.backward, prediction_month=pd.Timestamp(year=2020, month=2, day=1))
 
 
-@pytest.fixture()  # type: ignore
+def _assert_columns_equal(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+    """Compare column names, dtypes and values on the underlying arrays, ignoring the index."""
+    assert list(actual.columns) == list(expected.columns)
+    for column in expected.columns:
+        assert actual[column].dtype == expected[column].dtype, f"Unexpected dtype of column {column}"
+        if expected[column].dtype.kind == "f":
+            np.testing.assert_allclose(actual[column].to_numpy(), expected[column].to_numpy(), err_msg=column)
+        else:
+            np.testing.assert_array_equal(actual[column].to_numpy(), expected[column].to_numpy(), err_msg=column)
+
+
+def _assert_stored_rows(database: Database, statement: Select, expected: pd.DataFrame, message: str) -> None:
+    """Load the rows selected by ``statement`` into a data frame and compare them independent of row/column order."""
+    with database.transaction_context() as session:
+        result = pd.read_sql(statement, session.bind)
+
+    assert_frame_equal(
+        result.sort_values(["run_id", "Date"]).reset_index(drop=True),
+        expected.sort_values(["run_id", "Date"]).reset_index(drop=True),
+        check_dtype=False,
+        check_like=True,
+        obj=message,
+    )
+
+
+@pytest.fixture(scope="module")  # type: ignore
 def data_output() -> DataOutput:
+    """Share one DataOutput between tests, tests changing its attributes have to use ``monkeypatch``."""
     internal_database = Database(DatabaseType.internal)
     dsx_write_database = Database(DatabaseType.dsx_write)
     internal_database.is_disabled = lambda: True  # type: ignore
     return DataOutput(RUNTIME_CONFIG, internal_database, dsx_write_database)
 
 
-@pytest.fixture()  # type: ignore
+@pytest.fixture(scope="module")  # type: ignore
 def data_loader() -> DataLoader:
+    """Share one DataLoader between tests, to create the database engines only once per module."""
     internal_database = Database(DatabaseType.internal)
     dsx_read_database = Database(DatabaseType.dsx_read)
     internal_database.is_disabled = lambda: True  # type: ignore
     return DataLoader(internal_database, dsx_read_database)
 
 
-def test_store_result_as_csv(data_output: DataOutput, tmp_path: Path) -> None:
+@pytest.fixture(scope="module")  # type: ignore
+def account_1_data(data_loader: DataLoader) -> pd.DataFrame:
+    """Load account data of ModelConfigAccount1 from CSV once for all tests of this module, which only read it."""
+    model_config_account_1 = ModelConfigAccount1(runtime_config=RUNTIME_CONFIG, data_loader=data_loader)
+    return data_loader.load_account_data(model_config_account_1, -1)
+
+
+@pytest.fixture(scope="module")  # type: ignore
+def result_data_frame() -> pd.DataFrame:
+    """Share the result data between tests, store_result does not modify the given frame."""
+    return pd.DataFrame(TEST_DATA)
+
+
+def test_store_result_as_csv(data_output: DataOutput, result_data_frame: pd.DataFrame, tmp_path: Path) -> None:
     input_path = tmp_path / "test_csv_file.csv"
-    df = pd.DataFrame(TEST_DATA)
 
-    result_path = data_output.store_result(input_path, df)
+    result_path = data_output.store_result(input_path, result_data_frame)
 
     assert input_path == result_path
     assert EXPECTED_DATA == result_path.read_text()
 
 
-def test_store_result_as_csv_overwrite_existing(data_output: DataOutput, tmp_path: Path) -> None:
+def test_store_result_as_csv_overwrite_existing(
+    data_output: DataOutput, result_data_frame: pd.DataFrame, tmp_path: Path
+) -> None:
     input_path = tmp_path / "test_csv_file.csv"
     input_path.write_text("old_text")
-    df = pd.DataFrame(TEST_DATA)
 
-    result_path = data_output.store_result(input_path, df)
+    result_path = data_output.store_result(input_path, result_data_frame)
 
     assert input_path == result_path
     assert EXPECTED_DATA == result_path.read_text()
 
 
-def test_store_result_as_csv_and_ensure_correct_extension(data_output: DataOutput, tmp_path: Path) -> None:
+def test_store_result_as_csv_and_ensure_correct_extension(
+    data_output: DataOutput, result_data_frame: pd.DataFrame, tmp_path: Path
+) -> None:
     input_path = tmp_path / "test_csv_file.xlsx"
-    df = pd.DataFrame(TEST_DATA)
 
-    result_path = data_output.store_result(input_path, df)
+    result_path = data_output.store_result(input_path, result_data_frame)
 
     assert tmp_path / "test_csv_file.csv" == result_path
     assert EXPECTED_DATA == result_path.read_text()
 
 
-def test_store_result_as_xlsx_and_ensure_correct_extension(data_output: DataOutput, tmp_path: Path) -> None:
+def test_store_result_as_xlsx_and_ensure_correct_extension(
+    data_output: DataOutput, result_data_frame: pd.DataFrame, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
     input_path = tmp_path / "test_csv_file.csv"
-    df = pd.DataFrame(TEST_DATA)
     runtime_config_excel = RuntimeConfig(EngineRunType.development, output_format=OutputFormat.xlsx)
-    data_output._runtime_config = runtime_config_excel
-
-    result_path = data_output.store_result(input_path, df)
+    monkeypatch.setattr(data_output, "_runtime_config", runtime_config_excel)
+    mocked_to_excel = Mock()
+    monkeypatch.setattr(pd.DataFrame, "to_excel", mocked_to_excel)
 
-    excel_table = pd.read_excel(result_path)
+    result_path = data_output.store_result(input_path, result_data_frame)
 
     assert tmp_path / "test_csv_file.xlsx" == result_path
-    assert_frame_equal(pd.DataFrame(TEST_DATA), excel_table)
+    mocked_to_excel.assert_called_once_with(result_path, index=False)
+
+
+@pytest.mark.slow  # type: ignore
+def test_store_result_as_xlsx_roundtrip(
+    data_output: DataOutput, result_data_frame: pd.DataFrame, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    runtime_config_excel = RuntimeConfig(EngineRunType.development, output_format=OutputFormat.xlsx)
+    monkeypatch.setattr(data_output, "_runtime_config", runtime_config_excel)
+
+    result_path = data_output.store_result(tmp_path / "test_xlsx_file.xlsx", result_data_frame)
+
+    assert_frame_equal(result_data_frame, pd.read_excel(result_path))
 
 
-def test_store_result_create_parent_directories(data_output: DataOutput, tmp_path: Path) -> None:
+def test_store_result_as_parquet_and_ensure_correct_extension(
+    data_output: DataOutput, result_data_frame: pd.DataFrame, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    input_path = tmp_path / "test_csv_file.csv"
+    runtime_config_parquet = RuntimeConfig(EngineRunType.development, output_format=OutputFormat.parquet)
+    monkeypatch.setattr(data_output, "_runtime_config", runtime_config_parquet)
+
+    result_path = data_output.store_result(input_path, result_data_frame)
+
+    parquet_table = pd.read_parquet(result_path)
+
+    assert tmp_path / "test_csv_file.parquet" == result_path
+    assert_frame_equal(result_data_frame.astype({"Actual": "Int64"}), parquet_table)
+
+
+def test_store_result_create_parent_directories(
+    data_output: DataOutput, result_data_frame: pd.DataFrame, tmp_path: Path
+) -> None:
     input_path = tmp_path / "intermediate_directory" / "test_csv_file.csv"
-    df = pd.DataFrame(TEST_DATA)
 
-    result_path = data_output.store_result(input_path, df)
+    result_path = data_output.store_result(input_path, result_data_frame)
 
     assert input_path.parent / "test_csv_file.csv" == result_path
     assert EXPECTED_DATA == result_path.read_text()
 
 
-def test_store_result_raises_if_path_is_directory(data_output: DataOutput, tmp_path: Path) -> None:
+def test_store_result_raises_if_path_is_directory(
+    data_output: DataOutput, result_data_frame: pd.DataFrame, tmp_path: Path
+) -> None:
     input_path = tmp_path / "test_directory"
     input_path.mkdir()
-    df = pd.DataFrame(TEST_DATA)
 
     with pytest.raises(AttributeError, match="Path for saving is an existing directory!"):
-        data_output.store_result(input_path, df)
+        data_output.store_result(input_path, result_data_frame)
 
 
 @pytest.mark.parametrize(
@@ -396,13 +308,14 @@ def test_store_hyper_parameters(
     assert saved_path.name == "optimized_hyperparameters.json"
 
 
-def test_convert_forecast_data_account_1(data_output: DataOutput, data_loader: DataLoader) -> None:
+def test_convert_forecast_data_account_1(
+    data_output: DataOutput, data_loader: DataLoader, account_1_data: pd.DataFrame
+) -> None:
     model_config_account_1 = ModelConfigAccount1(runtime_config=RUNTIME_CONFIG, data_loader=data_loader,)
-    account_data = data_loader.load_account_data(model_config_account_1, -1)
 
     actual = data_output._convert_forecast_data(
         model_config=model_config_account_1,
-        account_data=account_data,
+        account_data=account_1_data,
         forecast_raw=TEST_ACCOUNT_1_RAW_DATA,
         forecast_post=TEST_ACCOUNT_1_POST_DATA,
         actuals_newest_month=datetime(2019, 12, 1, 0, 0),
@@ -413,27 +326,30 @@ def test_convert_forecast_data_account_1(data_output: DataOutput, data_loader: D
         len(actual) == expected_size_after_aggregation_by_primary_key
     ), "Not the expected size of dataframe after aggregation by primary key"
 
-    assert_frame_equal(actual.reset_index(drop=True), TEST_ACCOUNT_1_EXPECTED_FORECAST_DATA.reset_index(drop=True))
+    _assert_columns_equal(actual, TEST_ACCOUNT_1_EXPECTED_FORECAST_DATA)
 
 
 @pytest.mark.freeze_time(TEST_FREEZE_TIME)  # type: ignore
-def test_convert_dsx_data_account_1(data_output: DataOutput, data_loader: DataLoader) -> None:
+def test_convert_dsx_data_account_1(
+    data_output: DataOutput, data_loader: DataLoader, account_1_data: pd.DataFrame
+) -> None:
     model_config_account_1 = ModelConfigAccount1(runtime_config=RUNTIME_CONFIG, data_loader=data_loader)
-    account_data = data_loader.load_account_data(model_config_account_1, -1)
 
     actual = data_output._convert_dsx_output_data(
-        model_config=model_config_account_1, account_data=account_data, forecast_post=TEST_ACCOUNT_1_POST_DATA,
+        model_config=model_config_account_1, account_data=account_1_data, forecast_post=TEST_ACCOUNT_1_POST_DATA,
     )
 
     assert len(actual) == len(
         TEST_ACCOUNT_1_EXPECTED_DSX_OUTPUT_DATA
     ), "Not the expected size of dataframe after aggregation by model grouping and wesco master number"
 
-    assert_frame_equal(actual, TEST_ACCOUNT_1_EXPECTED_DSX_OUTPUT_DATA)
+    _assert_columns_equal(actual, TEST_ACCOUNT_1_EXPECTED_DSX_OUTPUT_DATA)
 
 
-def test_store_forecast_with_disabled_database(data_output: DataOutput, caplog: LogCaptureFixture) -> None:
-    data_output._internal_database._is_disabled = True
+def test_store_forecast_with_disabled_database(
+    data_output: DataOutput, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_output._internal_database, "_is_disabled", True)
 
     dummy_forecast = pd.DataFrame()
     model_run = ForecastModelRun()
@@ -447,21 +363,24 @@ def test_store_forecast_with_disabled_database(data_output: DataOutput, caplog:
 
 
 def test_not_store_backward_in_database(
-    data_loader: DataLoader, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch, tmp_path: Path,
+    data_loader: DataLoader,
+    account_1_data: pd.DataFrame,
+    caplog: LogCaptureFixture,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     internal_database = Database(DatabaseType.internal)
     dsx_write_database = Database(DatabaseType.dsx_write)
     data_output = DataOutput(RUNTIME_CONFIG, internal_database, dsx_write_database)
 
     model_config_account_1 = ModelConfigAccount1(runtime_config=RUNTIME_CONFIG, data_loader=data_loader)
-    account_data = data_loader.load_account_data(model_config_account_1, -1)
     model_run = ForecastModelRun()
     model_config_account_1.forecast_path = tmp_path
     with caplog.at_level(logging.DEBUG):
         returned_model_run = data_output.store_forecast(
             model_config=model_config_account_1,
             model_run=model_run,
-            account_data=account_data,
+            account_data=account_1_data,
             forecast_raw=TEST_ACCOUNT_1_RAW_DATA,
             forecast_post=TEST_ACCOUNT_1_POST_DATA,
             actuals_newest_month=datetime(2019, 10, 1, 0, 0),
@@ -471,6 +390,35 @@ def test_not_store_backward_in_database(
     assert "Skip storing forecast in internal database for backward run." in caplog.messages
 
 
+def test_store_forecast_skips_dsx_database_if_result_file_fails(
+    data_loader: DataLoader, account_1_data: pd.DataFrame, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    runtime_config = RuntimeConfig(EngineRunType.production, prediction_month=pd.Timestamp(year=2020, month=2, day=1))
+    data_output = DataOutput(runtime_config, Mock(spec=Database), Mock(spec=Database))
+
+    model_run = ForecastModelRun()
+    store_in_internal_database = Mock(return_value=model_run)
+    store_in_dsx_database = Mock(return_value=model_run)
+    monkeypatch.setattr(data_output, "store_result", Mock(side_effect=OSError("Disk full")))
+    monkeypatch.setattr(data_output, "_store_forecast_in_internal_database", store_in_internal_database)
+    monkeypatch.setattr(data_output, "_store_forecast_in_dsx_database", store_in_dsx_database)
+
+    model_config_account_1 = ModelConfigAccount1(runtime_config=runtime_config, data_loader=data_loader)
+    model_config_account_1.forecast_path = tmp_path
+    with pytest.raises(OSError, match="Disk full"):
+        data_output.store_forecast(
+            model_config=model_config_account_1,
+            model_run=model_run,
+            account_data=account_1_data,
+            forecast_raw=TEST_ACCOUNT_1_RAW_DATA,
+            forecast_post=TEST_ACCOUNT_1_POST_DATA,
+            actuals_newest_month=datetime(2019, 10, 1, 0, 0),
+        )
+
+    store_in_internal_database.assert_called_once()
+    store_in_dsx_database.assert_not_called()
+
+
 def test_store_cleaned_data_in_database() -> None:
     first_run_id = -100
     second_run_id = first_run_id + 1
@@ -482,43 +430,32 @@ def test_store_cleaned_data_in_database() -> None:
     delete_test_data(query_relevant_cleaned_data)  # Cleanup data from previously failed/cancelled test run
 
     cleaned_data = pd.DataFrame(
-        [
-            {
-                "Project_ID": "Test_Project",
-                "Contract_ID": "Contract_store_cleaned_data",
-                "Wesco_Master_Number": "Test_Master_Number",
-                "Date": datetime(2019, 12, 1, 0, 0),
-                "Date_YYYYMM": 201912,
-                "Item_ID": -1,
-                "Unit_Cost": 2.0,
-                "Order_Quantity": 10.0,
-                "Order_Cost": 20.0,
-            },
-            {
-                "Project_ID": "Test_Project",
-                "Contract_ID": "Contract_store_cleaned_data",
-                "Wesco_Master_Number": "Test_Master_Number",
-                "Date": datetime(2020, 1, 1, 0, 0),
-                "Date_YYYYMM": 202001,
-                "Item_ID": -1,
-                "Unit_Cost": 0.0,
-                "Order_Quantity": 0.0,
-                "Order_Cost": 0.0,
-            },
-        ]
+        {
+            "Project_ID": np.array(["Test_Project"] * 2, dtype=object),
+            "Contract_ID": np.array(["Contract_store_cleaned_data"] * 2, dtype=object),
+            "Wesco_Master_Number": np.array(["Test_Master_Number"] * 2, dtype=object),
+            "Date": pd.to_datetime(["2019-12-01", "2020-01-01"], format="%Y-%m-%d"),
+            "Date_YYYYMM": np.array([201912, 202001], dtype=np.int64),
+            "Item_ID": np.array([-1, -1], dtype=np.int64),
+            "Unit_Cost": np.array([2.0, 0.0], dtype=np.float64),
+            "Order_Quantity": np.array([10.0, 0.0], dtype=np.float64),
+            "Order_Cost": np.array([20.0, 0.0], dtype=np.float64),
+        }
     )
-    first_expected_cleaned_data = cleaned_data.assign(run_id=first_run_id).to_dict(orient="records")
-    second_expected_cleaned_data = cleaned_data.assign(run_id=second_run_id).to_dict(orient="records")
+    first_expected_cleaned_data = cleaned_data.assign(run_id=first_run_id)
+    second_expected_cleaned_data = cleaned_data.assign(run_id=second_run_id)
 
     internal_database = Database(DatabaseType.internal)
 
-    def _assert_expected_cleaned_data(expected_cleaned_data: List[Dict[str, Any]], message: str) -> None:
-        with internal_database.transaction_context() as session:
-            result = [row._asdict() for row in query_relevant_cleaned_data.with_session(session).all()]
-            assert expected_cleaned_data == result, message
+    relevant_cleaned_data_statement = query_relevant_cleaned_data.statement  # Build the SELECT once for all checks
+
+    def _assert_expected_cleaned_data(expected_cleaned_data: pd.DataFrame, message: str) -> None:
+        _assert_stored_rows(internal_database, relevant_cleaned_data_statement, expected_cleaned_data, message)
 
     data_output = DataOutput(RUNTIME_CONFIG, internal_database, Database(DatabaseType.dsx_write))
-    _assert_expected_cleaned_data([], "Expect empty cleaned data at beginning of test")
+    _assert_expected_cleaned_data(
+        first_expected_cleaned_data.iloc[:0], "Expect empty cleaned data at beginning of test"
+    )
 
     data_output.store_cleaned_data(cleaned_data, first_run_id)
     _assert_expected_cleaned_data(first_expected_cleaned_data, "Expect only first cleaned data run")
@@ -527,10 +464,12 @@ def test_store_cleaned_data_in_database() -> None:
     _assert_expected_cleaned_data(second_expected_cleaned_data, "Expect only second cleaned data run")
 
     data_output.store_cleaned_data(cleaned_data, first_run_id)  # This should not cleanup newer second run data
-    _assert_expected_cleaned_data(first_expected_cleaned_data + second_expected_cleaned_data, "Don't delete newer data")
+    _assert_expected_cleaned_data(
+        pd.concat([first_expected_cleaned_data, second_expected_cleaned_data]), "Don't delete newer data"
+    )
 
-    delete_test_data(query_relevant_cleaned_data)  # Cleanup data from test run
-    _assert_expected_cleaned_data([], "Expect empty cleaned data at end of test")
+    deleted_count = delete_test_data(query_relevant_cleaned_data)  # Cleanup data from test run
+    assert deleted_count == len(first_expected_cleaned_data) + len(second_expected_cleaned_data)
 
 
 def test_store_exogenous_features() -> None:
@@ -544,37 +483,29 @@ def test_store_exogenous_features() -> None:
     delete_test_data(query_relevant_data)  # Cleanup data from previously failed/cancelled test run
 
     exogenous_features = pd.DataFrame(
-        [
-            {
-                "Periodic_Data_Stream": "Test_Data",
-                "Airframe": "Test_Airframe",
-                "Contract_ID": "Contract_exogenous_feature",
-                "Project_ID": "Test_Project",
-                "Date": datetime(2019, 12, 1, 0, 0),
-                "Value": 20.0,
-            },
-            {
-                "Periodic_Data_Stream": "Test_Data",
-                "Airframe": "Test_Airframe",
-                "Contract_ID": "Contract_exogenous_feature",
-                "Project_ID": "Test_Project",
-                "Date": datetime(2020, 1, 1, 0, 0),
-                "Value": 0.1,
-            },
-        ]
+        {
+            "Periodic_Data_Stream": np.array(["Test_Data"] * 2, dtype=object),
+            "Airframe": np.array(["Test_Airframe"] * 2, dtype=object),
+            "Contract_ID": np.array(["Contract_exogenous_feature"] * 2, dtype=object),
+            "Project_ID": np.array(["Test_Project"] * 2, dtype=object),
+            "Date": pd.to_datetime(["2019-12-01", "2020-01-01"], format="%Y-%m-%d"),
+            "Value": np.array([20.0, 0.1], dtype=np.float64),
+        }
     )
-    first_expected_data = exogenous_features.assign(run_id=first_run_id).to_dict(orient="records")
-    second_expected_data = exogenous_features.assign(run_id=second_run_id).to_dict(orient="records")
+    first_expected_data = exogenous_features.assign(run_id=first_run_id)
+    second_expected_data = exogenous_features.assign(run_id=second_run_id)
 
     internal_database = Database(DatabaseType.internal)
 
-    def _assert_expected_exogenous_features(expected_exogenous_feature: List[Dict[str, Any]], message: str) -> None:
-        with internal_database.transaction_context() as session:
-            result = [row._asdict() for row in query_relevant_data.with_session(session).all()]
-            assert expected_exogenous_feature == sorted(result, key=itemgetter("run_id")), message
+    relevant_data_statement = query_relevant_data.statement  # Build the SELECT once for all checks
+
+    def _assert_expected_exogenous_features(expected_exogenous_feature: pd.DataFrame, message: str) -> None:
+        _assert_stored_rows(internal_database, relevant_data_statement, expected_exogenous_feature, message)
 
     data_output = DataOutput(RUNTIME_CONFIG, internal_database, Database(DatabaseType.dsx_write))
-    _assert_expected_exogenous_features([], "Expect empty exogenous feature data at beginning of test")
+    _assert_expected_exogenous_features(
+        first_expected_data.iloc[:0], "Expect empty exogenous feature data at beginning of test"
+    )
 
     data_output.store_exogenous_features(exogenous_features, first_run_id)
     _assert_expected_exogenous_features(first_expected_data, "Expect only first exogenous feature data run")
@@ -585,7 +516,9 @@ def test_store_exogenous_features() -> None:
 
     data_output.store_exogenous_features(exogenous_features, first_run_id)
     # This should not cleanup newer second run data
-    _assert_expected_exogenous_features(first_expected_data + second_expected_data, "Don't delete newer data")
+    _assert_expected_exogenous_features(
+        pd.concat([first_expected_data, second_expected_data]), "Don't delete newer data"
+    )
 
-    delete_test_data(query_relevant_data)  # Cleanup data from test run
-    _assert_expected_exogenous_features([], "Expect empty exogenous feature data at end of test")
+    deleted_count = delete_test_data(query_relevant_data)  # Cleanup data from test run
+    assert deleted_count == len(first_expected_data) + len(second_expected_data)
@@ -3,12 +3,18 @@ from __future__ import annotations
 import logging
 import os
 import platform
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+)
 from contextlib import contextmanager
 from functools import wraps
+from random import uniform
 from time import sleep
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterator,
     List,
     Optional,
@@ -20,7 +26,6 @@ from typing import (
 
 import pyodbc
 
-import numpy as np
 import pandas as pd
 from forecasting_platform import master_config
 from forecasting_platform.dsx_read_schema import DsxReadSchemaBase
@@ -56,12 +61,22 @@ class Database:
         ignore_missing_tables: Ignore DatabaseConnectionFailure in case of expected tables not existing.
     """
 
+    _SCHEMA_BASE_CLASSES: Dict[
+        DatabaseType, Union[Type[InternalSchemaBase], Type[DsxReadSchemaBase], Type[DsxWriteSchemaBase]]
+    ] = {
+        DatabaseType.internal: InternalSchemaBase,
+        DatabaseType.dsx_read: DsxReadSchemaBase,
+        DatabaseType.dsx_write: DsxWriteSchemaBase,
+    }
+
     def __init__(self, database_type: DatabaseType, ignore_missing_tables: bool = False) -> None:
         self._is_disabled = master_config.db_connection_attempts < 1
         self._ignore_missing_tables = ignore_missing_tables
         self._database_type = database_type
         self._database_schema = master_config.database_schema[self._database_type]
+        self._table_prefix = f"[{self._database_schema}]."
         self._optional_engine = self._initialize_engine()
+        self._session_class = sessionmaker()  # Create session class once, sessions are bound in transaction_context
 
     def __str__(self) -> str:
         return f"{self._database_type.name} database"
@@ -74,14 +89,10 @@ class Database:
     @property
     def schema_base_class(self) -> Union[Type[InternalSchemaBase], Type[DsxReadSchemaBase], Type[DsxWriteSchemaBase]]:
         """Base class for configured database schema."""
-        if self._database_type is DatabaseType.internal:
-            return InternalSchemaBase
-        if self._database_type is DatabaseType.dsx_read:
-            return DsxReadSchemaBase
-        if self._database_type is DatabaseType.dsx_write:
-            return DsxWriteSchemaBase
-
-        raise NotImplementedError(f"A base class defining tables of the {self} needs to be referenced here")
+        try:
+            return self._SCHEMA_BASE_CLASSES[self._database_type]
+        except KeyError:
+            raise NotImplementedError(f"A base class defining tables of the {self} needs to be referenced here")
 
     def is_disabled(self) -> bool:
         """Check if database has been disabled."""
@@ -119,8 +130,8 @@ class Database:
                     logger.warning(f"Unable to connect to {self} after {attempt} attempt(s).")
                     raise DatabaseConnectionFailure(str(error)) from error
 
-                sleep_seconds = master_config.db_connection_retry_sleep_seconds
-                logger.info(f"Waiting {sleep_seconds} seconds before next connection attempt")
+                sleep_seconds = _backoff_seconds(master_config.db_connection_retry_sleep_seconds, attempt)
+                logger.info(f"Waiting {sleep_seconds:g} seconds before next connection attempt")
                 sleep(sleep_seconds)
 
     def _initialize_engine(self) -> Optional[Engine]:
@@ -138,6 +149,9 @@ class Database:
             # see also https://github.com/mkleehammer/pyodbc/wiki/Features-beyond-the-DB-API#fast_executemany
             pool_pre_ping=True,  # Always check status of database connections before using them,
             # see also https://docs.sqlalchemy.org/en/13/core/pooling.html#disconnect-handling-pessimistic
+            pool_size=master_config.db_pool_size,  # Connections created by ``creator`` are reused via QueuePool
+            max_overflow=master_config.db_max_overflow,
+            pool_recycle=master_config.db_pool_recycle_seconds,
         )
 
         try:
@@ -163,8 +177,7 @@ class Database:
         Based on the SQLAlchemy recommendation:
             https://docs.sqlalchemy.org/en/13/orm/session_basics.html#session-faq-whentocreate
         """
-        session_class = sessionmaker(bind=self._engine)
-        session = cast(Session, session_class())
+        session = cast(Session, self._session_class(bind=self._engine))
 
         try:
             yield session
@@ -218,31 +231,96 @@ class Database:
             f"{self._database_schema}.{name}" for name in inspect(self._engine).get_table_names(self._database_schema)
         ]
 
-    def insert_data_frame(self, df: pd.DataFrame, table_name: str) -> None:
+    def insert_data_frame(self, df: pd.DataFrame, table_name: str, session: Optional[Session] = None) -> None:
         """Insert given ``df`` to database. Inserts are done in fixed-size batches to improve stability.
 
-        In case of an error only the currently inserted chunk will be rolled-back. Previous chunks remain in the DB.
+        Each batch is sent with a single parameterized ``INSERT`` using pyodbc ``fast_executemany``.
+
+        Without a ``session``, each chunk is inserted in its own transaction, using up to
+        :data:`~forecasting_platform.master_config.db_insert_parallelism` database connections concurrently.
+        In case of an error only the failed chunk will be rolled-back. Chunks which were already inserted remain in the
+        DB, chunks which were not started yet are skipped.
+        If a ``session`` is given, all chunks are inserted sequentially within its transaction instead,
+        so they are committed or rolled-back together with the other operations of that transaction.
 
         Args:
             df: :class:`~pandas.DataFrame` to insert to the given table of the database.
             table_name: Table of database to insert given :class:`~pandas.DataFrame`.
+            session: Optional session of an existing transaction (see :meth:`transaction_context`) to insert with.
         """
         total_size = len(df)
-        chunk_size = min(10 ** 4, total_size)
+        # Limit the number of bound parameters per chunk, so memory of wide data frames stays bounded
+        chunk_size = max(1, min(10 ** 4, master_config.db_insert_max_parameters // max(1, len(df.columns))))
 
         logger.info(f"Inserting {total_size} rows to {table_name} table of {self}",)
+        if total_size == 0:
+            return
 
-        for counter, chunk in df.groupby(np.arange(total_size) // chunk_size):
-            logger.debug(f"Inserting chunk {counter + 1} with shape {chunk.shape} to database table {table_name}")
-            with self.transaction_context() as session:
-                chunk.to_sql(
-                    table_name, session.connection(), schema=self._database_schema, if_exists="append", index=False
-                )
+        columns = ", ".join(f"[{column}]" for column in df.columns)
+        parameters = ", ".join("?" for _ in df.columns)
+        statement = f"INSERT INTO {self._table_prefix}[{table_name}] ({columns}) VALUES ({parameters})"
+
+        # Each chunk is only converted to Python objects right before its insert, to bound memory of large inserts
+        chunks = [df.iloc[start : start + chunk_size] for start in range(0, total_size, chunk_size)]
+
+        if session is not None:
+            # Reuse one cursor for all chunks, so the INSERT statement is only prepared once
+            with self._insert_cursor(session) as cursor:
+                for counter, chunk in enumerate(chunks):
+                    logger.debug(
+                        f"Inserting chunk {counter + 1} with shape {chunk.shape} to database table {table_name}"
+                    )
+                    cursor.executemany(statement, self._to_parameters(chunk))
+            return
+
+        with ThreadPoolExecutor(max_workers=master_config.db_insert_parallelism) as executor:
+            futures = [
+                executor.submit(self._insert_chunk_in_transaction, chunk, counter + 1, table_name, statement)
+                for counter, chunk in enumerate(chunks)
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except BaseException:
+                    for pending_future in futures:
+                        pending_future.cancel()  # Do not start inserting further chunks after the first failure
+                    raise
+
+    def _insert_chunk_in_transaction(self, chunk: pd.DataFrame, counter: int, table_name: str, statement: str) -> None:
+        logger.debug(f"Inserting chunk {counter} with shape {chunk.shape} to database table {table_name}")
+        with self.transaction_context() as session, self._insert_cursor(session) as cursor:
+            cursor.executemany(statement, self._to_parameters(chunk))
+
+    @staticmethod
+    def _to_parameters(chunk: pd.DataFrame) -> List[List[Any]]:
+        # Missing values have to be passed as None, other values as Python objects
+        return chunk.astype(object).where(chunk.notna(), None).to_numpy().tolist()
+
+    @staticmethod
+    @contextmanager
+    def _insert_cursor(session: Session) -> Iterator[pyodbc.Cursor]:
+        # Use the DBAPI cursor of the session connection, to insert within the transaction of the session
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.fast_executemany = True
+            yield cursor
+        finally:
+            cursor.close()
+
+
+def _backoff_seconds(base_seconds: float, attempt: int) -> float:
+    """Double the waiting time with each attempt, with random jitter to avoid simultaneous retries of all clients."""
+    return round(base_seconds * 2 ** (attempt - 1) * uniform(0.5, 1.5), 2)
 
 
 def retry_database_read_errors(function: F) -> F:
     """Retry a database read operation, if a :class:`~pyodbc.OperationalError` has been encountered.
 
+    A :class:`~pyodbc.InterfaceError` of a broken connection is retried as well.
+    Waiting time between retries grows exponentially, starting from
+    :data:`~forecasting_platform.master_config.db_read_retry_sleep_seconds`.
+
     Only intended for decorating functions, that do not manipulate data.
     Retry configuration is defined in :mod:`~forecasting_platform.master_config`.
 
@@ -257,16 +335,18 @@ def retry_database_read_errors(function: F) -> F:
     @wraps(function)
     def wrapper(*args, **kwargs):  # type: ignore
         retries = master_config.db_read_retries
-        sleep_seconds = master_config.db_read_retry_sleep_seconds
+        attempt = 1
         while retries > 0:
             try:
                 return function(*args, **kwargs)
-            except pyodbc.OperationalError as e:
+            except (pyodbc.OperationalError, pyodbc.InterfaceError) as e:
+                sleep_seconds = _backoff_seconds(master_config.db_read_retry_sleep_seconds, attempt)
                 logger.warning(
                     f"Error '{e}' occurred while running {function.__name__}. "
-                    f"Trying again {retries} more time(s) in {sleep_seconds} second(s)."
+                    f"Trying again {retries} more time(s) in {sleep_seconds:g} second(s)."
                 )
                 retries -= 1
+                attempt += 1
                 sleep(sleep_seconds)
         return function(*args, **kwargs)
 
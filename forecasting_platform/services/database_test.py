@@ -31,6 +31,12 @@ from .database import (
 )
 
 
+@pytest.fixture(autouse=True)  # type: ignore
+def without_retry_jitter(monkeypatch: MonkeyPatch) -> None:
+    """Make waiting times between retries deterministic."""
+    monkeypatch.setattr("forecasting_platform.services.database.uniform", lambda low, high: 1.0)
+
+
 @pytest.mark.parametrize("database_type", [DatabaseType.internal, DatabaseType.dsx_write])
 class TestDatabase:
     @pytest.mark.parametrize("attempts,is_disabled", [(-1, True), (0, True), (1, False), (10, False)])  # type: ignore
@@ -72,7 +78,7 @@ class TestDatabase:
             "Waiting 0.01 seconds before next connection attempt",
             f"Trying to connect to {database_type.name} database, attempt #2",
             f"Unsuccessful attempt #2 to connect to {database_type.name} database: Always fails!",
-            "Waiting 0.01 seconds before next connection attempt",
+            "Waiting 0.02 seconds before next connection attempt",
             f"Trying to connect to {database_type.name} database, attempt #3",
             f"Unsuccessful attempt #3 to connect to {database_type.name} database: Always fails!",
             f"Unable to connect to {database_type.name} database after 3 attempt(s).",
@@ -104,7 +110,7 @@ class TestDatabase:
             "Waiting 0.01 seconds before next connection attempt",
             f"Trying to connect to {database}, attempt #2",
             f"Unsuccessful attempt #2 to connect to {database}: Test Fail 2",
-            "Waiting 0.01 seconds before next connection attempt",
+            "Waiting 0.02 seconds before next connection attempt",
             f"Trying to connect to {database}, attempt #3",
             f"Successfully connected to {database}",
         ]
@@ -182,7 +188,7 @@ class TestDatabase:
         )
         assert f"Error during {database} operation, transaction was rolled-back: Error 1" in caplog.messages
         assert (
-            "Error 'Error 2' occurred while running query_with_retry. Trying again 1 more time(s) in 1 second(s)."
+            "Error 'Error 2' occurred while running query_with_retry. Trying again 1 more time(s) in 2 second(s)."
             in caplog.messages
         )
         assert f"Error during {database} operation, transaction was rolled-back: Error 2" in caplog.messages
@@ -257,4 +263,41 @@ def test_internal_database_insert_data_frame_chunking(
     with internal_database.transaction_context() as session:
         assert session.query(table).count() == row_count  # type: ignore
 
-    assert caplog.messages == expected_logs
+    assert sorted(caplog.messages) == sorted(expected_logs)  # Chunks are logged by parallel insert threads
+
+
+def test_internal_database_insert_data_frame_limits_parameters_per_chunk(
+    tmp_internal_table: Tuple[Database, Table], caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+) -> None:
+    internal_database, table = tmp_internal_table
+    monkeypatch.setattr(master_config, "db_insert_max_parameters", 10)
+
+    caplog.set_level(logging.DEBUG)
+
+    df = pd.DataFrame({"test_numbers": range(23)})
+    internal_database.insert_data_frame(df, table.name)
+
+    with internal_database.transaction_context() as session:
+        assert session.query(table).count() == 23  # type: ignore
+
+    assert sorted(caplog.messages) == [
+        "Inserting 23 rows to test-tmp-internal-database table of internal database",
+        "Inserting chunk 1 with shape (10, 1) to database table test-tmp-internal-database",
+        "Inserting chunk 2 with shape (10, 1) to database table test-tmp-internal-database",
+        "Inserting chunk 3 with shape (3, 1) to database table test-tmp-internal-database",
+    ]
+
+
+def test_internal_database_insert_data_frame_with_session_is_rolled_back_together(
+    tmp_internal_table: Tuple[Database, Table]
+) -> None:
+    internal_database, table = tmp_internal_table
+
+    df = pd.DataFrame({"test_numbers": range(12345)})
+    with pytest.raises(RuntimeError, match="Abort transaction"):
+        with internal_database.transaction_context() as session:
+            internal_database.insert_data_frame(df, table.name, session=session)
+            raise RuntimeError("Abort transaction")
+
+    with internal_database.transaction_context() as session:
+        assert session.query(table).count() == 0  # type: ignore
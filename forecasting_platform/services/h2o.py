@@ -1,5 +1,4 @@
 import logging
-import traceback
 from typing import (
     Any,
     List,
@@ -119,9 +118,27 @@ def _patch_h2o_upload_python_object() -> None:
         except PermissionError as error:
             # Ugly workaround to ignore PermissionError from the temporary file cleanup,
             # see https://github.com/h2oai/h2o-3/blob/master/h2o-py/h2o/frame.py#L150
-            if traceback.extract_tb(error.__traceback__)[1].line == "os.remove(tmp_path)  # delete the tmp file":
+            if _is_tmp_file_cleanup_error(error):
                 logger.warning(f"Ignoring error from H2O temporary file cleanup, with unknown root-cause: {error}")
             else:
                 raise
 
     H2OFrame._upload_python_object = wrapped_upload_python_object
+
+
+def _is_tmp_file_cleanup_error(error: PermissionError) -> bool:
+    """Check if ``error`` was raised by removing ``tmp_path`` directly in ``H2OFrame._upload_python_object``.
+
+    Only the traceback frames are inspected, to avoid reading source files like :func:`traceback.extract_tb`.
+    """
+    upload_traceback = error.__traceback__.tb_next if error.__traceback__ else None
+    if upload_traceback is None:
+        return False
+
+    upload_frame = upload_traceback.tb_frame
+    return bool(
+        upload_frame.f_code.co_name == "_upload_python_object"
+        and upload_traceback.tb_next is None  # os.remove is implemented in C, so it adds no frame
+        and error.filename is not None
+        and error.filename == upload_frame.f_locals.get("tmp_path")
+    )
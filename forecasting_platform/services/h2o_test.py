@@ -13,6 +13,7 @@ from . import h2o
 from .h2o import (
     _connect_h2o_server,
     _init_h2o_server,
+    _is_tmp_file_cleanup_error,
     initialize_h2o_connection,
 )
 
@@ -94,3 +95,15 @@ def test_initialize_h2o_connection_fails_if_can_not_connect_to_locally_started_s
     with pytest.raises(H2OConnectionError):
         with closing(initialize_h2o_connection(urls=[], fallback_port=FALLBACK_H20_PORT)) as connection:
             assert connection is None
+
+
+def _upload_python_object(tmp_path: str, removed_path: str) -> None:
+    raise PermissionError(13, "The process cannot access the file", removed_path)
+
+
+@pytest.mark.parametrize("removed_path, is_cleanup_error", [("tmp.csv", True), ("other.csv", False)])  # type: ignore
+def test_is_tmp_file_cleanup_error(removed_path: str, is_cleanup_error: bool) -> None:
+    with pytest.raises(PermissionError) as error_info:
+        _upload_python_object(tmp_path="tmp.csv", removed_path=removed_path)
+
+    assert _is_tmp_file_cleanup_error(error_info.value) == is_cleanup_error
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
@@ -186,14 +187,21 @@ def initialize_subprocess(runtime_config: RuntimeConfig, log_context: str) -> It
         initialize_random_seed()
         initialize_warnings()
 
-        # H2O needs to be initialized for each process, because the connection pool cannot be serialized.
-        h2o_connection = initialize_h2o_connection(master_config.h2o_urls, master_config.fallback_h2o_port)
-
-        # Database connections have to be initialized for each process, because the connection pool cannot be serialized
-        # See: https://docs.sqlalchemy.org/en/13/core/pooling.html#using-connection-pools-with-multiprocessing
-        internal_database = Database(DatabaseType.internal)
-        dsx_read_database = Database(DatabaseType.dsx_read)
-        dsx_write_database = Database(DatabaseType.dsx_write)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # H2O needs to be initialized for each process, because the connection pool cannot be serialized.
+            # Connect in the background, while the database connections are initialized.
+            h2o_future = executor.submit(
+                initialize_h2o_connection, master_config.h2o_urls, master_config.fallback_h2o_port
+            )
+
+            # Database connections have to be initialized for each process, because the pool cannot be serialized
+            # See: https://docs.sqlalchemy.org/en/13/core/pooling.html#using-connection-pools-with-multiprocessing
+            # They are initialized sequentially, because the reflection of the table definitions is not thread-safe.
+            internal_database = Database(DatabaseType.internal)
+            dsx_read_database = Database(DatabaseType.dsx_read)
+            dsx_write_database = Database(DatabaseType.dsx_write)
+
+            h2o_connection = h2o_future.result()
         data_output = DataOutput(runtime_config, internal_database, dsx_write_database)
         data_loader = DataLoader(internal_database, dsx_read_database)
 
@@ -71,6 +71,7 @@ def initialize_subprocess_logging(log_queue: "Queue[logging.LogRecord]") -> None
     logging.config.dictConfig(logging_config)
 
     _reduce_noise_from_library_loggers()
+    _skip_unused_record_attributes()
 
     logger.debug(f"Initialized logging for sub-process (pid={os.getpid()}, parent={os.getppid()})")
 
@@ -80,8 +81,7 @@ class SubProcessQueueHandler(QueueHandler):
 
     def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
         """Override method to include account log-context from sub-process."""
-        if not hasattr(record, "account"):
-            record.account = _account_log_context  # type: ignore
+        record.__dict__.setdefault("account", _account_log_context)
 
         return super().prepare(record)  # type: ignore
 
@@ -112,12 +112,9 @@ def _log_unhandled_exceptions() -> None:
 
 class _LogAccountFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
-        if not hasattr(record, "account"):
-            record.account = _account_log_context  # type: ignore
+        record.__dict__.setdefault("account", _account_log_context)
 
-        result = logging.Formatter.format(self, record)
-
-        return result
+        return logging.Formatter.format(self, record)
 
 
 def _configure_logging(command_name: str) -> None:
@@ -152,6 +149,14 @@ def _configure_logging(command_name: str) -> None:
     logging.config.dictConfig(logging_config)
 
     _reduce_noise_from_library_loggers()
+    _skip_unused_record_attributes()
+
+
+def _skip_unused_record_attributes() -> None:
+    """Avoid collecting thread and process information for each log record, it is not part of the logging format."""
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
 
 def _reduce_noise_from_library_loggers() -> None:
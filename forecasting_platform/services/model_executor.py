@@ -1,5 +1,8 @@
 import logging
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    as_completed,
+)
 from multiprocessing import Queue
 from multiprocessing.context import SpawnContext
 from typing import (
@@ -22,12 +25,15 @@ def execute_models(
     log_queue: "Queue[logging.LogRecord]",
     execution_function: Callable[..., None],
     execution_functions_args: Sequence[object],
-) -> None:  # pragma: no cover
+) -> None:
     """Execute a parallelized or sequential model run, depending on current configuration.
 
     If only a single model is executed or :data:`~forecasting_platform.master_config.max_parallel_models` is 1,
     then no multi-processing is used and the models are run within the main process.
 
+    Errors are logged as soon as a model fails. If :data:`~forecasting_platform.master_config.fail_fast_models` is set,
+    models which have not started yet are cancelled after the first error.
+
     Args:
         runtime_config: Current RuntimeConfig.
         multiprocessing_context: Context to use for :class:`ProcessPoolExecutor`.
@@ -58,11 +64,16 @@ def execute_models(
             for model_config_class in runtime_config.model_configs
         ]
 
-    last_error = None
-    for result in results:
-        if error := result.exception():
-            logger.error(f"Error during multiprocessing: {error}")
-            last_error = error
+        last_error = None
+        for result in as_completed(results):
+            if result.cancelled():
+                continue
+            if error := result.exception():
+                logger.error(f"Error during multiprocessing: {error}")
+                last_error = error
+                if master_config.fail_fast_models:
+                    for pending_result in results:
+                        pending_result.cancel()  # Only affects models which are not running yet
 
     if last_error:
         raise last_error
@@ -0,0 +1,64 @@
+import logging
+from concurrent.futures import Future
+from typing import (
+    Any,
+    List,
+)
+from unittest.mock import Mock
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+from forecasting_platform import master_config
+
+from .model_executor import execute_models
+from .runtime_config import RuntimeConfig
+
+
+class _QueuedFuture(Future):  # type: ignore
+    """Future of a model which is still queued, cancelling it notifies waiters like a real executor would."""
+
+    def cancel(self) -> bool:
+        cancelled = super().cancel()
+        if cancelled:
+            self.set_running_or_notify_cancel()
+        return cancelled
+
+
+def test_execute_models_cancels_pending_models_after_first_error(
+    monkeypatch: MonkeyPatch, caplog: LogCaptureFixture
+) -> None:
+    futures: List[Future] = []  # type: ignore
+
+    class FakeProcessPoolExecutor:
+        """Fail the first submitted model and keep all other models queued."""
+
+        def __init__(self, **kwargs: Any) -> None:
+            pass
+
+        def __enter__(self) -> "FakeProcessPoolExecutor":
+            return self
+
+        def __exit__(self, *args: Any) -> None:
+            pass
+
+        def submit(self, *args: Any) -> Future:  # type: ignore
+            future = _QueuedFuture()
+            if not futures:
+                future.set_exception(RuntimeError("Model failed"))
+            futures.append(future)
+            return future
+
+    monkeypatch.setattr("forecasting_platform.services.model_executor.ProcessPoolExecutor", FakeProcessPoolExecutor)
+    monkeypatch.setattr(master_config, "max_parallel_models", 2)
+    monkeypatch.setattr(master_config, "fail_fast_models", True)
+    runtime_config = Mock(spec=RuntimeConfig, model_configs=["ModelConfigA", "ModelConfigB", "ModelConfigC"])
+
+    with pytest.raises(RuntimeError, match="Model failed"):
+        with caplog.at_level(logging.ERROR):
+            execute_models(runtime_config, Mock(), Mock(), Mock(), [])
+
+    assert len(futures) == 3
+    assert not futures[0].cancelled()
+    assert all(future.cancelled() for future in futures[1:])
+    assert caplog.messages == ["Error during multiprocessing: Model failed"]
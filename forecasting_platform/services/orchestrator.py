@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from datetime import datetime
 from multiprocessing import Queue
 from multiprocessing.context import SpawnContext
@@ -219,8 +223,20 @@ class Orchestrator:
     def _handle_generic_preprocessing(self) -> None:
         if self._runtime_config.includes_cleaning:
             logger.info("Starting import and cleaning of DSX input data")
-            self._import_exogenous_features()
-            self._import_cleaned_data()
+            # Exogenous features are independent of the cleaned data and stored in a separate table,
+            # so they are imported in the background while the DSX input data is cleaned.
+            executor = ThreadPoolExecutor(max_workers=1)
+            exogenous_features_future = executor.submit(self._import_exogenous_features)
+            try:
+                self._import_cleaned_data()
+            except BaseException:
+                # Do not wait for the background import, so errors and interrupts take effect immediately
+                exogenous_features_future.add_done_callback(Orchestrator._log_exogenous_features_error)
+                raise
+            else:
+                exogenous_features_future.result()
+            finally:
+                executor.shutdown(wait=False)
         else:
             logger.info(f"Skipping data cleaning for {self._runtime_config.engine_run_type}")
 
@@ -249,6 +265,11 @@ class Orchestrator:
         raw_dsx_input = self._data_loader.load_exogenous_feature_input_data()
         self._data_output.store_exogenous_features(raw_dsx_input, forecast_run_id=self._forecast_run_id)
 
+    @staticmethod
+    def _log_exogenous_features_error(future: Future[None]) -> None:
+        if not future.cancelled() and future.exception():
+            logger.error(f"Import of exogenous features failed: {future.exception()}")
+
     def _determine_cleaned_data_newest_month(self) -> datetime:
         if self._internal_database.is_disabled():
             logger.warning("Internal database connection disabled. Assuming newest month is prediction_month.")
@@ -1,4 +1,6 @@
 import logging
+import threading
+from concurrent.futures import Future
 from contextlib import contextmanager
 from datetime import datetime
 from multiprocessing.queues import Queue
@@ -75,10 +77,8 @@ class ModelConfigAccountTestDummy(BaseModelConfig):
     def prepare_training_data(
         self, sales: pd.DataFrame, grouping: List[str], exo_features: ExogenousFeatures,
     ) -> TimeSeries:
-        dummy_time_series = TimeSeries(
-            pd.DataFrame(data={"date": [datetime.utcnow()], "response": [1]}), "date", "response"
-        )
-        return dummy_time_series
+        # Fixed date instead of the current time, so the dummy training data is deterministic
+        return TimeSeries(pd.DataFrame(data={"date": [pd.Timestamp(2020, 1, 1)], "response": [1]}), "date", "response")
 
     def postprocess_forecast(
         self, ts: TimeSeries, ts_pred: TimeSeries, sales: pd.DataFrame, grouping: List[str]
@@ -339,3 +339,43 @@ def test_determine_cleaned_data_run_id_development_run(with_cleaned_data_in_data
 def test_determine_cleaned_data_run_id_invalid(with_cleaned_data_in_database: OrchestratorResult) -> None:
     with pytest.raises(DataException, match="Cannot determine valid cleaning data"):
         with_cleaned_data_in_database.orchestrator._determine_cleaned_data_run_id()
+
+
+def test_handle_generic_preprocessing_raises_cleaning_error_without_waiting_for_exogenous_features(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    orchestrator = setup_orchestrator_result().orchestrator
+    monkeypatch.setattr(orchestrator._runtime_config, "engine_run_type", EngineRunType.development)
+
+    exogenous_features_started = threading.Event()
+    exogenous_features_released = threading.Event()
+    exogenous_features_finished = threading.Event()
+
+    def slow_import_exogenous_features() -> None:
+        exogenous_features_started.set()
+        exogenous_features_released.wait(timeout=10)
+        exogenous_features_finished.set()
+
+    def failing_import_cleaned_data() -> None:
+        exogenous_features_started.wait(timeout=10)
+        raise RuntimeError("Cleaning failed")
+
+    monkeypatch.setattr(orchestrator, "_import_exogenous_features", slow_import_exogenous_features)
+    monkeypatch.setattr(orchestrator, "_import_cleaned_data", failing_import_cleaned_data)
+
+    try:
+        with pytest.raises(RuntimeError, match="Cleaning failed"):
+            orchestrator._handle_generic_preprocessing()
+        assert not exogenous_features_finished.is_set(), "Error was delayed until the background import finished"
+    finally:
+        exogenous_features_released.set()
+
+
+def test_log_exogenous_features_error(caplog: LogCaptureFixture) -> None:
+    future: Future = Future()  # type: ignore
+    future.set_exception(RuntimeError("Exogenous features failed"))
+
+    with caplog.at_level(logging.ERROR):
+        orchestrator_module.Orchestrator._log_exogenous_features_error(future)
+
+    assert caplog.messages == ["Import of exogenous features failed: Exogenous features failed"]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -93,21 +94,23 @@ class RuntimeConfig:
 
     @staticmethod
     def _toggle_forecast_direction(engine_run_type: EngineRunType, forecast_periods: int) -> Tuple[int, int]:
-        if engine_run_type == EngineRunType.backward:
+        if engine_run_type is EngineRunType.backward:
             return forecast_periods, 0
         return 0, forecast_periods
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _compute_forecast_start(
         prediction_month: pd.Timestamp, test_periods: int, engine_run_type: EngineRunType
     ) -> pd.Timestamp:
         return (
             prediction_month - pd.DateOffset(months=test_periods - 1)
-            if engine_run_type == EngineRunType.backward
+            if engine_run_type is EngineRunType.backward
             else prediction_month
         )
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _compute_forecast_end(forecast_start: pd.Timestamp, full_forecast_periods: int) -> pd.Timestamp:
         return forecast_start + pd.DateOffset(months=full_forecast_periods - 1)
 
@@ -3,10 +3,10 @@ PREDICTION_MONTH_FORMAT = "%Y%m"
 PREDICT_RESULT_TYPE = "predict"
 TRAIN_RESULT_TYPE = "train"
 
-#: List of Microsoft SQL Server information values to be logged during initialization.
+#: Microsoft SQL Server information values to be logged during initialization.
 #: For all available information types in MS SQL Server, see:
 #: https://docs.microsoft.com/en-us/sql/odbc/reference/syntax/sqlgetinfo-function#information-types
-MS_SQL_DATABASE_INFOS = [
+MS_SQL_DATABASE_INFOS = (
     "SQL_ODBC_VER",
     "SQL_DBMS_NAME",
     "SQL_DBMS_VER",
@@ -17,7 +17,7 @@ MS_SQL_DATABASE_INFOS = [
     "SQL_TXN_ISOLATION_OPTION",
     "SQL_CURSOR_COMMIT_BEHAVIOR",
     "SQL_CURSOR_ROLLBACK_BEHAVIOR",
-]
+)
 
 #: Entry for each CLI run
 FORECAST_RUN_TABLE = "forecast_run"
@@ -5,7 +5,8 @@ from enum import (
     auto,
     unique,
 )
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet
 
 
 @unique
@@ -23,6 +24,7 @@ class OutputFormat(Enum):
 
     csv = "csv"
     xlsx = "xlsx"
+    parquet = "parquet"
 
 
 @unique
@@ -59,7 +61,13 @@ class ForecastRunStatus(Enum):
         -------
             ``True`` if this is an end-state, ``False`` otherwise.
         """
-        return self in {ForecastRunStatus.CANCELLED, ForecastRunStatus.COMPLETED, ForecastRunStatus.FAILED}
+        return self in self.get_end_states()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_end_states() -> FrozenSet[ForecastRunStatus]:
+        """Set of all end states for this enum, created only once."""
+        return frozenset({ForecastRunStatus.CANCELLED, ForecastRunStatus.COMPLETED, ForecastRunStatus.FAILED})
 
 
 @unique
@@ -93,10 +101,9 @@ class ForecastModelRunStatus(Enum):
         return self in self.get_end_states()
 
     @staticmethod
-    def get_end_states() -> Set[ForecastModelRunStatus]:
-        """Set of all end states for this enum."""
-        return {
-            ForecastModelRunStatus.CANCELLED,
-            ForecastModelRunStatus.COMPLETED,
-            ForecastModelRunStatus.FAILED,
-        }
+    @lru_cache(maxsize=None)
+    def get_end_states() -> FrozenSet[ForecastModelRunStatus]:
+        """Set of all end states for this enum, created only once."""
+        return frozenset(
+            {ForecastModelRunStatus.CANCELLED, ForecastModelRunStatus.COMPLETED, ForecastModelRunStatus.FAILED}
+        )
@@ -1,4 +1,6 @@
 import logging
+from random import uniform
+from time import sleep
 
 from forecasting_platform.services import Database
 from forecasting_platform.static import DatabaseType
@@ -7,24 +9,33 @@ from sqlalchemy.orm import Query
 
 logger = logging.getLogger("delete_test_data")
 
+_RETRY_SLEEP_SECONDS = 0.1
 
-def delete_test_data(db_query: Query, retry: bool = True) -> int:
+
+def delete_test_data(db_query: Query, retries: int = 2) -> int:
     """Delete database objects based on user query. Intended to be used only for integration tests cleanup.
 
+    Rows are removed with a single bulk ``DELETE`` statement, without loading them into the session first.
+
     Args:
         db_query: sqlalchemy Query object that defines the rows to delete
-        retry: Attempt retry in case of deadlock errors due to parallel runs of tests
+        retries: Number of retries in case of deadlock errors due to parallel runs of tests
 
     Returns:
         Number of deleted rows.
 
     """
-    try:
-        with Database(DatabaseType.internal).transaction_context() as session:
-            return int(db_query.with_session(session).delete(synchronize_session=False))  # type: ignore
-    except DBAPIError as e:  # pragma: no cover
-        if retry:  # Retry in case of deadlock error from the database when running tests in parallel
-            logger.warning(f"Retrying error: {e}")
-            return delete_test_data(db_query, retry=False)
-        else:
-            raise
+    database = Database(DatabaseType.internal)
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            with database.transaction_context() as session:
+                return int(db_query.with_session(session).delete(synchronize_session=False))  # type: ignore
+        except DBAPIError as e:  # pragma: no cover
+            if attempt > retries:
+                raise
+            # Retry in case of deadlock error from the database when running tests in parallel
+            sleep_seconds = round(uniform(0, _RETRY_SLEEP_SECONDS * 2 ** (attempt - 1)), 3)
+            logger.warning(f"Retrying error in {sleep_seconds:g} second(s): {e}")
+            sleep(sleep_seconds)
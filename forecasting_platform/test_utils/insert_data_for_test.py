@@ -43,15 +43,13 @@ def insert_cleaned_data_for_database_test(
     delete_test_data(Query(CleanedData).filter(CleanedData.c.run_id == test_run_id))  # type: ignore
 
     # Insert fresh cleaned data for this test
+    internal_database = Database(DatabaseType.internal)
+    data_directory = Path(master_config.default_data_loader_location) / master_config.account_processed_data_path
     for contract in model_config_class.CONTRACTS:  # type: ignore
-        file_path = (
-            Path(master_config.default_data_loader_location)
-            / master_config.account_processed_data_path
-            / f"DSX_{contract}_Data.csv.gz"
-        )
-        cleaned_data = pd.read_csv(file_path)
+        file_path = data_directory / f"DSX_{contract}_Data.csv.gz"
+        cleaned_data = pd.read_csv(file_path, usecols=SALES_COLUMNS)
         cleaned_data = cleaned_data[SALES_COLUMNS].assign(run_id=test_run_id)
-        Database(DatabaseType.internal).insert_data_frame(cleaned_data, CLEANED_DATA_TABLE)
+        internal_database.insert_data_frame(cleaned_data, CLEANED_DATA_TABLE)
 
     yield
 